@@ -47,7 +47,15 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        # SQLAlchemy 2.0 + Alembic 1.13 batch autogenerate reflection (get_multi_*) per schema,
+        # so keep it to the default schema and skip server-default comparison round-trips.
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_schemas=False,
+            render_as_batch=connection.dialect.name == "sqlite",
+            compare_server_default=False,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -11,6 +11,8 @@ Changes:
 - Rename notes -> note (singular)
 - Remove deprecated columns (institution, factsheet, student_review, etc.)
 - Add name_kr index for search optimization
+- Copy existing rows into the new table instead of dropping them
+- Build secondary/unique indexes after the data copy (load-then-index)
 """
 
 from alembic import op
@@ -23,6 +25,109 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
+# (인덱스명, 컬럼, unique 여부)
+UNIVERSITY_INDEXES = [
+    ("idx_university_country", "country", False),
+    ("idx_university_region", "region", False),
+    ("idx_university_program", "program_type", False),
+    ("idx_university_serial", "serial_number", True),
+    ("idx_university_name_kr", "name_kr", False),
+]
+
+
+def _create_university_indexes() -> None:
+    """
+    universities 인덱스 생성 (DB별로 테이블 잠금/재구성 최소화)
+
+    - MySQL: ALTER TABLE 한 번에 모든 인덱스 추가 (테이블 재구성 1회)
+    - PostgreSQL: CREATE INDEX CONCURRENTLY (트랜잭션 밖에서 실행해야 함)
+    - 기타: op.create_index
+    """
+    dialect = op.get_bind().dialect.name
+    if dialect == "mysql":
+        clauses = ", ".join(
+            f"ADD {'UNIQUE ' if unique else ''}INDEX {name} ({column})"
+            for name, column, unique in UNIVERSITY_INDEXES
+        )
+        op.execute(f"ALTER TABLE universities {clauses}")
+    elif dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, column, unique in UNIVERSITY_INDEXES:
+                op.create_index(
+                    name, "universities", [column], unique=unique, postgresql_concurrently=True
+                )
+    else:
+        for name, column, unique in UNIVERSITY_INDEXES:
+            op.create_index(name, "universities", [column], unique=unique)
+
+
+COPY_BATCH_SIZE = 1000
+
+# (새 컬럼, 기존 컬럼 후보, NULL 대체값)
+COPY_COLUMNS = [
+    ("university_id", ("university_id",), None),
+    ("serial_number", ("serial_number",), None),
+    ("program_type", ("program_type",), "''"),
+    ("region", ("region",), "'미분류'"),
+    ("country", ("country",), None),
+    ("name_kr", ("name_kr",), None),
+    ("name_en", ("name_en",), None),
+    ("department_info", ("department_info",), None),
+    ("website_url", ("website_url",), None),
+    ("note", ("note", "notes"), None),
+    ("language_requirement", ("language_requirement",), None),
+    ("min_gpa", ("min_gpa",), None),
+    ("source_file", ("source_file",), None),
+    ("created_at", ("created_at",), "CURRENT_TIMESTAMP"),
+    ("updated_at", ("updated_at",), "CURRENT_TIMESTAMP"),
+]
+
+
+def _copy_universities(source: str, target: str) -> None:
+    """
+    기존 universities 데이터를 새 테이블로 복사
+
+    university_id 범위 단위(COPY_BATCH_SIZE)로 INSERT ... SELECT를 나누어 실행하고
+    배치마다 커밋하여 하나의 거대한 트랜잭션/락을 피함
+    (변환이 모두 SQL 식으로 표현되므로 Python으로 행을 가져오지 않고 DB 내부에서 복사)
+    """
+    bind = op.get_bind()
+    old_columns = {c["name"] for c in sa.inspect(bind).get_columns(source)}
+
+    insert_cols = []
+    select_exprs = []
+    for new_col, candidates, fallback in COPY_COLUMNS:
+        old_col = next((c for c in candidates if c in old_columns), None)
+        if old_col is None:
+            continue
+        insert_cols.append(new_col)
+        select_exprs.append(f"COALESCE({old_col}, {fallback})" if fallback else old_col)
+
+    min_id, max_id = bind.execute(
+        sa.text(f"SELECT MIN(university_id), MAX(university_id) FROM {source}")
+    ).one()
+    if min_id is None:
+        return
+
+    copy_sql = sa.text(
+        f"INSERT INTO {target} ({', '.join(insert_cols)}) "
+        f"SELECT {', '.join(select_exprs)} FROM {source} "
+        "WHERE university_id > :lo AND university_id <= :hi"
+    )
+    is_mysql = bind.dialect.name == "mysql"
+    with op.get_context().autocommit_block():
+        if is_mysql:
+            # 기존 테이블에서 이미 검증된 데이터이므로 적재 중 무결성 검사 생략
+            op.execute("SET SESSION unique_checks = 0")
+            op.execute("SET SESSION foreign_key_checks = 0")
+        try:
+            for lo in range(min_id - 1, max_id, COPY_BATCH_SIZE):
+                op.execute(copy_sql.bindparams(lo=lo, hi=lo + COPY_BATCH_SIZE))
+        finally:
+            if is_mysql:
+                op.execute("SET SESSION foreign_key_checks = 1")
+                op.execute("SET SESSION unique_checks = 1")
+
 
 def upgrade() -> None:
     """
@@ -45,6 +150,8 @@ def upgrade() -> None:
         - created_at (TIMESTAMP)
         - updated_at (TIMESTAMP)
     """
+    inspector = sa.inspect(op.get_bind())
+
     try:
         op.drop_constraint(
             "language_scores_university_id_fkey",
@@ -54,12 +161,13 @@ def upgrade() -> None:
     except Exception as e:
         print(f"Warning: Could not drop foreign key constraint 'language_scores_university_id_fkey' from 'language_scores'. It might not exist. Error: {e}")
 
-    # 기존 테이블 삭제
-    op.drop_table("universities", if_exists=True)
+    # 기존 테이블이 있으면 새 테이블을 옆에 만들어 데이터를 옮긴 뒤 교체 (비파괴적)
+    has_old_table = inspector.has_table("universities")
+    target_table = "universities_new" if has_old_table else "universities"
 
     # 새 테이블 생성
     op.create_table(
-        "universities",
+        target_table,
         # Primary Key
         sa.Column(
             "university_id",
@@ -68,11 +176,10 @@ def upgrade() -> None:
             nullable=False,
             comment="시스템 내부 고유 식별자 (자동 증가)",
         ),
-        # Serial Number (Unique)
+        # Serial Number (Unique - 데이터 적재 후 unique 인덱스로 생성)
         sa.Column(
             "serial_number",
             sa.String(20),
-            unique=True,
             nullable=True,
             comment="국제처 엑셀 파일 내 고유 번호 (예: E0011)",
         ),
@@ -167,18 +274,23 @@ def upgrade() -> None:
             nullable=False,
             comment="레코드 최종 수정 시각",
         ),
-        # Constraints
+        # Constraints (PK만 먼저 생성, 보조 인덱스는 적재 후 생성)
         sa.PrimaryKeyConstraint("university_id"),
-        sa.UniqueConstraint("serial_number"),
     )
 
-    # 인덱스 생성
-    op.create_index("idx_university_country", "universities", ["country"])
-    op.create_index("idx_university_region", "universities", ["region"])
-    op.create_index("idx_university_program", "universities", ["program_type"])
-    op.create_index("idx_university_serial", "universities", ["serial_number"])
-    op.create_index("idx_university_name_kr", "universities", ["name_kr"])
+    if has_old_table:
+        _copy_universities("universities", target_table)
+        op.drop_table("universities")
+        op.rename_table(target_table, "universities")
+        if op.get_bind().dialect.name == "postgresql":
+            # id를 직접 복사했으므로 시퀀스를 현재 최대값으로 맞춤
+            op.execute(
+                "SELECT setval(pg_get_serial_sequence('universities', 'university_id'), "
+                "COALESCE(MAX(university_id), 1)) FROM universities"
+            )
 
+    # 인덱스 생성 (load-then-index: 데이터 적재 후 한 번에 정렬 빌드)
+    _create_university_indexes()
 
 
 
@@ -1,62 +1,77 @@
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.extract.excel_reader import ExcelReader
 from src.config import settings
+from src.utils import list_xlsx
 import pandas as pd
 import re
 
+_FILENAME_RE = re.compile(r"(\d{4})[-_](\d|여름|겨울).*?학기")
+_HEADER_KEYWORDS = ("파견국가", "국가", "대학명")
+_HEADER_RE = re.compile("|".join(map(re.escape, _HEADER_KEYWORDS)))
+
+def scan_one(file_path: Path) -> dict:
+    """Scan a single file for its raw header row. Returns a plain (picklable) dict."""
+    result = {"name": file_path.name, "headers": None, "next_row": None, "regex": None, "error": None}
+    try:
+        # Raw (unmapped) header row and the row below it, read directly since ExcelReader maps them;
+        # read_only streams rows, so we can stop as soon as the header row is found
+        from openpyxl import load_workbook
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        sheet = wb.active
+
+        # Find header row (same logic as Reader)
+        header_row = None
+        next_row_raw = None
+        for row in sheet.iter_rows(values_only=True, max_row=30):
+            if header_row is not None:
+                next_row_raw = row
+                break
+            row_strs = [str(c) for c in row if c is not None]
+            if any(_HEADER_RE.search(cell) for cell in row_strs):
+                header_row = row
+        wb.close()
+
+        if header_row is not None:
+            result["headers"] = [str(x).strip() if x else f"Unnamed_{i}" for i, x in enumerate(header_row)]
+
+            # Check next row for sub-headers
+            if next_row_raw is not None:
+                result["next_row"] = [str(x).strip() if x else "None" for x in next_row_raw]
+
+            # Regex Check
+            match = _FILENAME_RE.search(file_path.name)
+            result["regex"] = match.groups() if match else "NO MATCH"
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
 def analyze_headers():
     data_dir = settings.raw_data_dir
-    files = sorted(list(data_dir.glob("*.xlsx")))
-    
+    files = list_xlsx(data_dir)
+
     unique_headers = set()
     header_mapping = {} # Header -> count
-    
+
     print(f"Scanning {len(files)} files...")
-    
-    for file_path in files:
-        if file_path.name.startswith("~"): continue
-        try:
-            # We need to peek at raw headers before mapping
-            # But ExcelReader maps them inside read().
-            # Let's use openpyxl directly or modify ExcelReader to show raw headers.
-            # actually logic in ExcelReader:
-            # headers = [str(x).strip() if x else f"Unnamed_{i}" for i, x in enumerate(data[header_idx])]
-            
-            # Let's instantiate Reader and use its _find_header_row logic if possible, 
-            # or just read and see what's unmapped (original names are lost).
-            
-            # Better: Write a mini-reader here to see RAW headers
-            from openpyxl import load_workbook
-            wb = load_workbook(file_path, data_only=True)
-            sheet = wb.active
-            data = []
-            for row in sheet.rows:
-                data.append([cell.value for cell in row])
-            
-            # Find header row (same logic as Reader)
-            keywords = ["파견국가", "국가", "대학명"]
-            if header_idx != -1:
-                headers = [str(x).strip() if x else f"Unnamed_{i}" for i, x in enumerate(data[header_idx])]
-                print(f"\n[{file_path.name}]")
-                print(f"Headers: {headers}")
-                
-                # Check next row for sub-headers
-                if header_idx + 1 < len(data):
-                    next_row = [str(x).strip() if x else "None" for x in data[header_idx+1]]
-                    print(f"Next Row: {next_row}")
-                
-                # Regex Check
-                match = re.search(r"(\d{4})[-_](\d|여름|겨울).*?학기", file_path.name)
-                print(f"Regex match: {match.groups() if match else 'NO MATCH'}")
-                
+
+    # Files are independent and parsing is CPU-bound, so fan out across processes
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for result in ex.map(scan_one, files, chunksize=4):
+            if result["error"]:
+                print(f"Error reading {result['name']}: {result['error']}")
+            elif result["headers"] is not None:
+                print(f"\n[{result['name']}]")
+                print(f"Headers: {result['headers']}")
+                if result["next_row"] is not None:
+                    print(f"Next Row: {result['next_row']}")
+                print(f"Regex match: {result['regex']}")
             else:
-                print(f"\n[{file_path.name}] Header row not found with keywords {keywords}")
-                
-        except Exception as e:
-            print(f"Error reading {file_path.name}: {e}")
+                print(f"\n[{result['name']}] Header row not found with keywords {list(_HEADER_KEYWORDS)}")
 
 if __name__ == "__main__":
     analyze_headers()
@@ -1,21 +1,44 @@
+import argparse
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.load.database import DatabaseLoader
+from src.load.database import get_loader
 from src.load.models import University
-from sqlalchemy import select, func
+from sqlalchemy import select, func, text
 
-def check_db():
-    loader = DatabaseLoader()
+def check_db(exact: bool = False):
+    loader = get_loader()
     with loader.SessionLocal() as session:
-        count = session.scalar(select(func.count(University.id)))
-        print(f"Total universities in DB: {count}")
-        
+        count = None
+        if not exact and loader.engine.dialect.name == "mysql":
+            # InnoDB COUNT(*) scans the whole index; the table statistics are O(1) and good enough here
+            count = session.execute(
+                text(
+                    "SELECT TABLE_ROWS FROM information_schema.tables "
+                    "WHERE table_schema = DATABASE() AND table_name = :table"
+                ),
+                {"table": University.__tablename__},
+            ).scalar()
+            if count is not None:
+                print(f"Total universities in DB (estimate): {count}")
+        if count is None:
+            count = session.scalar(select(func.count(University.id)))
+            print(f"Total universities in DB: {count}")
+
         # Check a sample
-        sample = session.scalars(select(University).limit(5)).all()
+        sample = session.execute(
+            select(University.name_kor, University.nation, University.has_review).limit(5)
+        ).all()
         for u in sample:
             print(f"Sample: {u.name_kor} ({u.nation}) - Review: {u.has_review}")
 
 if __name__ == "__main__":
-    check_db()
+    parser = argparse.ArgumentParser(description="Print university row count and a sample")
+    parser.add_argument(
+        "--exact",
+        action="store_true",
+        help="Use COUNT(*) instead of the information_schema estimate (MySQL)",
+    )
+    args = parser.parse_args()
+    check_db(exact=args.exact)
@@ -2,31 +2,36 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.load.database import DatabaseLoader
+from src.load.database import get_loader
 from src.load.models import University
-from sqlalchemy import select, func
+from sqlalchemy import case, select, func
 
 def check_values():
-    loader = DatabaseLoader()
+    loader = get_loader()
     with loader.SessionLocal() as session:
-        # Total count
-        count = session.scalar(select(func.count(University.id)))
+        # All counts in a single table scan / round-trip
+        stmt = select(
+            func.count(University.id),
+            func.sum(case((University.semester == 'Unknown', 1), else_=0)),
+            func.sum(case((University.min_gpa > 0, 1), else_=0)),
+            func.sum(case((University.available_majors.is_not(None), 1), else_=0)),
+        )
+        count, unknown_semester, valid_gpa, valid_majors = session.execute(stmt).one()
         print(f"Total universities: {count}")
-        
-        # Check 'Unknown' semester
-        unknown_semester = session.scalar(select(func.count(University.id)).where(University.semester == 'Unknown'))
-        print(f"Universities with 'Unknown' semester: {unknown_semester}")
-        
-        # Check min_gpa > 0
-        valid_gpa = session.scalar(select(func.count(University.id)).where(University.min_gpa > 0))
-        print(f"Universities with min_gpa > 0: {valid_gpa}")
-        
-        # Check available_majors not null
-        valid_majors = session.scalar(select(func.count(University.id)).where(University.available_majors.is_not(None)))
-        print(f"Universities with available_majors: {valid_majors}")
+        print(f"Universities with 'Unknown' semester: {unknown_semester or 0}")
+        print(f"Universities with min_gpa > 0: {valid_gpa or 0}")
+        print(f"Universities with available_majors: {valid_majors or 0}")
         
         # Sample non-null values
-        sample = session.scalars(select(University).limit(5)).all()
+        sample = session.execute(
+            select(
+                University.name_kor,
+                University.semester,
+                University.min_gpa,
+                University.available_majors,
+                University.has_review,
+            ).limit(5)
+        ).all()
         for u in sample:
             print(f"[{u.name_kor}] Sem: {u.semester}, GPA: {u.min_gpa}, Major: {u.available_majors[:30] if u.available_majors else 'None'}..., Review: {u.has_review}")
 
@@ -20,7 +20,8 @@ try:
   cnx = mysql.connector.connect(**config)
   print("Connection successful!")
   
-  cursor = cnx.cursor()
+  # buffered so SHOW TABLES is fully drained before the DDL runs
+  cursor = cnx.cursor(buffered=True)
   
   # Try to drop tables manually here if connection works
   print("Dropping all tables...")
@@ -28,9 +29,10 @@ try:
   
   cursor.execute("SHOW TABLES")
   tables = [table[0] for table in cursor]
-  for table in tables:
-      print(f"Dropping table {table}...")
-      cursor.execute(f"DROP TABLE `{table}`")
+  if tables:
+      # One DROP statement for all tables instead of a round-trip per table
+      print(f"Dropping tables {tables}...")
+      cursor.execute("DROP TABLE " + ", ".join(f"`{table}`" for table in tables))
       
   cursor.execute("SET FOREIGN_KEY_CHECKS = 1;")
   print("All tables dropped.")
@@ -1,36 +1,29 @@
 
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+_BLANK_WS_LINE_RE = re.compile(rb'(?m)^[ \t\f\v]+(?=\r?$)')
+
 def fix_lint(file_path):
     path = Path(file_path)
     if not path.exists():
         print(f"File not found: {file_path}")
         return
 
-    with open(path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    # Whitespace-only lines -> empty lines, in a single native regex pass
+    data = path.read_bytes()
+    new, count = _BLANK_WS_LINE_RE.subn(b'', data)
+    if new != data: # Skip the write (and mtime bump) when nothing changed
+        path.write_bytes(new)
 
-    fixed_lines = []
-    count = 0
-    for line in lines:
-        if not line.strip(): # If line is empty or whitespace only
-            if len(line) > 1: # If it contains whitespace (more than just newline)
-                fixed_lines.append('\n') # Replace with just newline
-                count += 1
-            else:
-                fixed_lines.append(line)
-        else:
-            fixed_lines.append(line)
-    
-    with open(path, 'w', encoding='utf-8') as f:
-        f.writelines(fixed_lines)
-    
     print(f"Fixed {count} lines in {file_path}")
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
-        for f in sys.argv[1:]:
-            fix_lint(f)
+        # IO-bound, so threads are enough to overlap the reads/writes
+        with ThreadPoolExecutor() as ex:
+            list(ex.map(fix_lint, sys.argv[1:]))
     else:
         print("Usage: python fix_lint.py <file1> <file2> ...")
@@ -1,47 +1,58 @@
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.extract.excel_reader import ExcelReader
 from src.config import settings
+from src.utils import list_xlsx
 import pandas as pd
 
+def scan_one(file_path: Path) -> dict:
+    """Inspect a single file. Returns a plain (picklable) dict with the report lines."""
+    lines = [f"\nScanning: {file_path.name}\n"]
+    try:
+        reader = ExcelReader(file_path)
+        df = reader.read()
+        lines.append(f"Total Rows: {len(df)}\n")
+        
+        # Check for critical columns
+        if "name_eng" in df.columns:
+            null_eng = df["name_eng"].isna().sum()
+            empty_eng = (df["name_eng"] == "").sum()
+            lines.append(f"'name_eng' - None: {null_eng}, Empty string: {empty_eng}\n")
+            
+            # Show valid/invalid counts for critical trio
+            valid_mask = df["name_kor"].notna() & df["name_eng"].notna() & df["nation"].notna()
+            lines.append(f"Valid Rows (all 3 present): {valid_mask.sum()}\n")
+            lines.append(f"Invalid Rows: {(~valid_mask).sum()}\n")
+            
+            if (~valid_mask).sum() > 0:
+                lines.append("Sample Invalid Rows:\n")
+                invalid_df = df[~valid_mask].head(5)
+                for idx, row in invalid_df.iterrows():
+                    lines.append(f"  {idx}: kor={row.get('name_kor')}, eng={row.get('name_eng')}, nation={row.get('nation')}\n")
+        else:
+             lines.append(f"'name_eng' column MISSING!\n")
+
+    except Exception as e:
+        lines.append(f"Error reading {file_path.name}: {e}\n")
+    return {"name": file_path.name, "lines": lines}
+
 def inspect_content():
     data_dir = settings.raw_data_dir
-    files = sorted(list(data_dir.glob("*.xlsx")))
+    files = list_xlsx(data_dir)
     
     with open("inspection_content.txt", "w", encoding="utf-8") as f:
         f.write(f"Found {len(files)} files.\n")
         
-        for file_path in files[:3]: # Check first 3 files
-            if file_path.name.startswith("~"): continue
-            f.write(f"\nScanning: {file_path.name}\n")
-            try:
-                reader = ExcelReader(file_path)
-                df = reader.read()
-                f.write(f"Total Rows: {len(df)}\n")
-                
-                # Check for critical columns
-                if "name_eng" in df.columns:
-                    null_eng = df["name_eng"].isna().sum()
-                    empty_eng = (df["name_eng"] == "").sum()
-                    f.write(f"'name_eng' - None: {null_eng}, Empty string: {empty_eng}\n")
-                    
-                    # Show valid/invalid counts for critical trio
-                    valid_mask = df["name_kor"].notna() & df["name_eng"].notna() & df["nation"].notna()
-                    f.write(f"Valid Rows (all 3 present): {valid_mask.sum()}\n")
-                    f.write(f"Invalid Rows: {(~valid_mask).sum()}\n")
-                    
-                    if (~valid_mask).sum() > 0:
-                        f.write("Sample Invalid Rows:\n")
-                        invalid_df = df[~valid_mask].head(5)
-                        for idx, row in invalid_df.iterrows():
-                            f.write(f"  {idx}: kor={row.get('name_kor')}, eng={row.get('name_eng')}, nation={row.get('nation')}\n")
-                else:
-                     f.write(f"'name_eng' column MISSING!\n")
-
-            except Exception as e:
-                f.write(f"Error reading {file_path.name}: {e}\n")
+        targets = files[:3] # Check first 3 files
+        # Files are independent and parsing is CPU-bound, so give each file its own process
+        workers = min(len(targets), os.cpu_count() or 1) or 1
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for result in ex.map(scan_one, targets, chunksize=1):
+                f.writelines(result["lines"])
 
 if __name__ == "__main__":
     inspect_content()
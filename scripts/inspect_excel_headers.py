@@ -1,40 +1,51 @@
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.extract.excel_reader import ExcelReader
 from src.config import settings
+from src.utils import list_xlsx
+
+def scan_one(file_path: Path) -> dict:
+    """Inspect a single file. Returns a plain (picklable) dict with the report lines."""
+    lines = [f"\nScanning: {file_path.name}\n"]
+    try:
+        reader = ExcelReader(file_path)
+        df = reader.read()
+        lines.append(f"Mapped Columns: {df.columns.tolist()}\n")
+        
+        # Check for critical columns
+        missing = []
+        for req in ["name_kor", "name_eng", "nation"]:
+            if req not in df.columns:
+                missing.append(req)
+        
+        if missing:
+            lines.append(f"WARNING: Missing mapped columns: {missing}\n")
+        
+        # Show first row
+        if not df.empty:
+            lines.append(f"First row: {df.iloc[0].to_dict()}\n")
+            
+    except Exception as e:
+        lines.append(f"Error reading {file_path.name}: {e}\n")
+    return {"name": file_path.name, "lines": lines}
 
 def inspect_headers():
     data_dir = settings.raw_data_dir
-    files = sorted(list(data_dir.glob("*.xlsx")))
+    files = list_xlsx(data_dir)
     
     with open("inspection_output.txt", "w", encoding="utf-8") as f:
         f.write(f"Found {len(files)} files.\n")
         
-        for file_path in files[:3]: # Check first 3 files
-            if file_path.name.startswith("~"): continue
-            f.write(f"\nScanning: {file_path.name}\n")
-            try:
-                reader = ExcelReader(file_path)
-                df = reader.read()
-                f.write(f"Mapped Columns: {df.columns.tolist()}\n")
-                
-                # Check for critical columns
-                missing = []
-                for req in ["name_kor", "name_eng", "nation"]:
-                    if req not in df.columns:
-                        missing.append(req)
-                
-                if missing:
-                    f.write(f"WARNING: Missing mapped columns: {missing}\n")
-                
-                # Show first row
-                if not df.empty:
-                    f.write(f"First row: {df.iloc[0].to_dict()}\n")
-                    
-            except Exception as e:
-                f.write(f"Error reading {file_path.name}: {e}\n")
+        targets = files[:3] # Check first 3 files
+        # Files are independent and parsing is CPU-bound, so give each file its own process
+        workers = min(len(targets), os.cpu_count() or 1) or 1
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for result in ex.map(scan_one, targets, chunksize=1):
+                f.writelines(result["lines"])
 
 if __name__ == "__main__":
     inspect_headers()
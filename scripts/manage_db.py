@@ -1,3 +1,4 @@
+import functools
 import os
 import sys
 import shutil
@@ -12,22 +13,35 @@ sys.path.append(str(project_root))
 
 from src.config import settings
 
-def reset_database():
-    """Drop all tables in the database to ensure a clean slate."""
+@functools.lru_cache(maxsize=1)
+def _get_engine():
+    """Shared engine for this one-shot CLI (NullPool: nothing worth pooling)."""
     # Force use of pymysql for stability with special chars in password
     db_url = settings.database_url.replace("mysql+mysqlconnector", "mysql+pymysql")
     print(f"Connecting to database: {db_url.split('@')[-1]}") # Log safe part
-    engine = sqlalchemy.create_engine(db_url)
+    return sqlalchemy.create_engine(db_url, poolclass=sqlalchemy.pool.NullPool)
+
+def reset_database():
+    """Drop all tables in the database to ensure a clean slate."""
+    engine = _get_engine()
     meta = sqlalchemy.MetaData()
     
     try:
         meta.reflect(bind=engine)
+        if not meta.tables:
+            print("No tables found. Nothing to drop.")
+            return
         print(f"Found {len(meta.tables)} tables. Dropping all...")
-        meta.drop_all(bind=engine)
-        # Also drop alembic_version table explicitly if it exists (though drop_all usually covers it)
-        with engine.connect() as conn:
+        is_mysql = engine.dialect.name == "mysql"
+        # Single transaction; skip FK validation while dropping (MySQL)
+        with engine.begin() as conn:
+            if is_mysql:
+                conn.execute(sqlalchemy.text("SET FOREIGN_KEY_CHECKS=0"))
+            meta.drop_all(bind=conn)
+            # Also drop alembic_version table explicitly if it exists (though drop_all usually covers it)
             conn.execute(sqlalchemy.text("DROP TABLE IF EXISTS alembic_version"))
-            conn.commit()
+            if is_mysql:
+                conn.execute(sqlalchemy.text("SET FOREIGN_KEY_CHECKS=1"))
         print("Database cleaned.")
     except Exception as e:
         print(f"Error resetting database: {e}")
@@ -38,12 +52,11 @@ def clear_alembic_versions():
     versions_dir = project_root / "alembic" / "versions"
     if versions_dir.exists():
         print("Clearing alembic/versions/ directory...")
-        for file in versions_dir.glob("*.py"):
-            file.unlink()
-        # Also remove __pycache__
-        pycache = versions_dir / "__pycache__"
-        if pycache.exists():
-            shutil.rmtree(pycache)
+        # Remove the whole directory (revisions + __pycache__) in one recursive walk
+        shutil.rmtree(versions_dir, ignore_errors=True)
+    versions_dir.mkdir(parents=True, exist_ok=True)
+    # Keep the tracked placeholder so the directory survives in git
+    (versions_dir / ".gitkeep").touch()
     print("Alembic versions cleared.")
 
 def run_alembic_migration():
@@ -89,7 +102,7 @@ def run_alembic_migration():
 
 def verify_schema():
     """Check if 'university' table has 'badge' column."""
-    engine = sqlalchemy.create_engine(settings.database_url)
+    engine = _get_engine()
     insp = sqlalchemy.inspect(engine)
     columns = [c['name'] for c in insp.get_columns('university')]
     
@@ -1,31 +1,47 @@
+import re
 import sys
+from collections import deque
+from itertools import islice
 from pathlib import Path
 
+KEYWORDS = ["Extracted", "Cleaned", "Loaded", "ERROR", "WARNING", "Total", "ReviewParser"]
+_KEYWORD_RE = re.compile("|".join(map(re.escape, KEYWORDS)))
+CONTEXT_LINES = 24
+
+def _detect_encoding(path):
+    """Pick the codec from the first bytes: UTF-16LE (BOM or ASCII-with-NULs, as PowerShell writes it) else UTF-8."""
+    with open(path, "rb") as f:
+        head = f.read(4)
+    if head[:2] == b"\xff\xfe":
+        return "utf-16"  # consumes the BOM
+    if len(head) == 4 and head[1] == 0 and head[3] == 0:
+        return "utf-16-le"
+    return "utf-8-sig"
+
+def _iter_lines(path):
+    """Yield lines of the log, decoded once with the detected encoding."""
+    with open(path, "r", encoding=_detect_encoding(path)) as f:
+        yield from f
+
+def _emit(window):
+    """Print the oldest buffered line if it matches; ERROR lines get the buffered lines after them as context."""
+    line = window.popleft()
+    if _KEYWORD_RE.search(line):
+        print(line.strip())
+        if "ERROR" in line:
+            for ctx in islice(window, CONTEXT_LINES):
+                print(f"  CTX: {ctx.strip()}")
+
 def print_log():
-    keywords = ["Extracted", "Cleaned", "Loaded", "ERROR", "WARNING", "Total", "ReviewParser"]
+    # Only the current line + the next CONTEXT_LINES lines are held in memory
+    window = deque()
     try:
-        with open("etl.log", "r", encoding="utf-16le") as f:
-            lines = f.readlines()
-            for i, line in enumerate(lines):
-                if any(k in line for k in keywords):
-                    print(line.strip())
-                    if "ERROR" in line:
-                         for j in range(1, 25):
-                             if i + j < len(lines):
-                                 print(f"  CTX: {lines[i+j].strip()}")
-    except UnicodeError:
-        try:
-             with open("etl.log", "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                for i, line in enumerate(lines):
-                    if any(k in line for k in keywords):
-                        print(line.strip())
-                        if "ERROR" in line:
-                            for j in range(1, 25):
-                                if i + j < len(lines):
-                                    print(f"  CTX: {lines[i+j].strip()}")
-        except Exception as e:
-            print(f"Error with utf-8: {e}")
+        for line in _iter_lines("etl.log"):
+            window.append(line)
+            if len(window) > CONTEXT_LINES:
+                _emit(window)
+        while window:
+            _emit(window)
     except Exception as e:
         print(f"Error reading log: {e}")
 
@@ -1,9 +1,13 @@
 """Main ETL pipeline runner."""
 
 import argparse
+import multiprocessing
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple
+from typing import Dict, Iterator, List, Optional, Union, Tuple
+
+import pandas as pd
 
 import logging
 # Add project root to path
@@ -13,7 +17,7 @@ from src.config import settings
 from src.extract import ExcelReader
 from src.load import DatabaseLoader
 from src.transform import DataCleaner
-from src.utils import get_logger
+from src.utils import get_logger, list_excel_files
 
 logger = get_logger(__name__, level=logging.DEBUG)
 file_handler = logging.FileHandler("etl_debug.log", encoding="utf-8")
@@ -21,12 +25,8 @@ file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelnam
 logger.addHandler(file_handler)
 
 
-def process_file(
-    file_path: Path,
-    loader: DatabaseLoader,
-    dry_run: bool = False,
-) -> Dict[str, int]:
-    """Process a single Excel file through the ETL pipeline."""
+def extract_and_clean(file_path: Path) -> pd.DataFrame:
+    """Extract + transform a single Excel file. Has no DB access, so it is safe to run in a worker process."""
     logger.info(f"Processing: {file_path.name}")
 
     # Extract
@@ -45,7 +45,7 @@ def process_file(
 
     if len(df) == 0:
         logger.warning(f"  No data extracted from {file_path.name}")
-        return {"inserted": 0, "updated": 0, "skipped": 0}
+        return df
 
     # Transform
     cleaner = DataCleaner(df)
@@ -57,6 +57,18 @@ def process_file(
         logger.info(f"  Columns: {list(df_clean.columns)}")
         logger.info(f"  Sample row: {df_clean.iloc[0].to_dict()}")
 
+    return df_clean
+
+
+def load_file(
+    df_clean: pd.DataFrame,
+    loader: DatabaseLoader,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """Load a cleaned DataFrame into the database."""
+    if len(df_clean) == 0:
+        return {"inserted": 0, "updated": 0, "skipped": 0}
+
     if dry_run:
         logger.info("  [DRY RUN] Skipping database load")
         return {"inserted": 0, "updated": 0, "skipped": 0}
@@ -68,6 +80,38 @@ def process_file(
     return stats
 
 
+def process_file(
+    file_path: Path,
+    loader: DatabaseLoader,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """Process a single Excel file through the ETL pipeline."""
+    return load_file(extract_and_clean(file_path), loader, dry_run=dry_run)
+
+
+def iter_cleaned(files: List[Path], workers: int) -> Iterator[Tuple[Path, Optional[pd.DataFrame], Optional[Exception]]]:
+    """
+    Yield (file, cleaned DataFrame, error) in file order.
+    With workers > 1, extract/transform runs in a process pool; loading stays in the caller
+    so upserts on the same (name_eng, nation) key across files never race.
+    """
+    if workers <= 1:
+        for file_path in files:
+            try:
+                yield file_path, extract_and_clean(file_path), None
+            except Exception as e:
+                yield file_path, None, e
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        results = pool.imap(extract_and_clean, files)
+        for file_path in files:
+            try:
+                yield file_path, next(results), None
+            except Exception as e:
+                yield file_path, None, e
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run ETL pipeline for exchange data")
     parser.add_argument(
@@ -101,6 +145,12 @@ def main() -> None:
         action="store_true",
         help="Only process the latest file (by filename)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes for extract/transform (DB load stays sequential)",
+    )
     args = parser.parse_args()
 
     # Initialize database
@@ -119,9 +169,8 @@ def main() -> None:
     if args.file:
         files = [args.file]
     elif args.input.is_dir():
-        all_files = list(args.input.glob("*.xlsx")) + list(args.input.glob("*.xls"))
-        # Filter out temporary Excel files (starting with ~$)
-        files = sorted([f for f in all_files if not f.name.startswith("~")])
+        # One directory pass for .xlsx/.xls; temporary Excel files (~$) are skipped
+        files = list_excel_files(args.input)
     else:
         files = [args.input]
 
@@ -136,20 +185,22 @@ def main() -> None:
     logger.info(f"Files to process: {[f.name for f in files]}")
 
     # Process files
-    total_stats = {"inserted": 0, "updated": 0, "skipped": 0}
+    total_stats = Counter({"inserted": 0, "updated": 0, "skipped": 0})
 
-    for file_path in files:
+    for file_path, df_clean, error in iter_cleaned(files, args.workers):
         try:
-            stats = process_file(file_path, loader, dry_run=args.dry_run)
-            for key in total_stats:
-                total_stats[key] += stats.get(key, 0)
+            if error is not None:
+                raise error
+            stats = load_file(df_clean, loader, dry_run=args.dry_run)
+            # update() (unlike +=) keeps zero counts, so the summary always lists every key
+            total_stats.update(stats)
         except Exception as e:
             logger.error(f"Error processing {file_path}: {e}")
             import traceback
             traceback.print_exc()
             continue
 
-    logger.info(f"ETL Complete. Total: {total_stats}")
+    logger.info(f"ETL Complete. Total: {dict(total_stats)}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
+import json
 import os
-import subprocess
 import sys
 from pathlib import Path
+from typing import Dict, Iterator, Tuple
 
 # Add project root to sys.path
 current_dir = Path(__file__).resolve().parent
@@ -10,20 +11,88 @@ sys.path.insert(0, str(project_root))
 
 from src.config import settings
 
+UPLOAD_CONCURRENCY = 32  # requests in flight across all uploads
+MANIFEST_PATH = project_root / "data" / ".sync_manifest.json"
+
+
+def parse_s3_uri(uri: str) -> Tuple[str, str]:
+    """Split 's3://bucket/some/prefix/' into ('bucket', 'some/prefix/')."""
+    if not uri.startswith("s3://"):
+        raise ValueError(f"Invalid S3 URI: {uri}")
+    bucket, _, prefix = uri[len("s3://"):].partition("/")
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+    return bucket, prefix
+
+
+def iter_local_files(root: Path) -> Iterator[Tuple[str, os.stat_result]]:
+    """Recursively yield (relative posix path, stat) for every file under root."""
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    rel = Path(entry.path).relative_to(root).as_posix()
+                    yield rel, entry.stat()
+
+
+def list_remote_objects(client, bucket: str, prefix: str) -> Dict[str, Tuple[int, float]]:
+    """One paginated sweep of the prefix: key -> (size, last_modified timestamp)."""
+    remote: Dict[str, Tuple[int, float]] = {}
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            remote[obj["Key"]] = (obj["Size"], obj["LastModified"].timestamp())
+    return remote
+
+
+def load_manifest(path: Path, target_uri: str) -> Dict[str, Tuple[int, float]]:
+    """Read rel -> (size, mtime) recorded by the last sync to target_uri; empty if missing or for another target."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("target") != target_uri:
+        return {}
+    return {rel: (entry["size"], entry["mtime"]) for rel, entry in manifest.get("files", {}).items()}
+
+
+def save_manifest(path: Path, target_uri: str, files: Dict[str, Tuple[int, float]]) -> None:
+    """Persist rel -> (size, mtime) of the files known to be in sync with target_uri."""
+    payload = {
+        "target": target_uri,
+        "files": {rel: {"size": size, "mtime": mtime} for rel, (size, mtime) in sorted(files.items())},
+    }
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
 def sync_to_s3():
     """
     Sync local data/raw to S3.
-    Uses credentials from .env via src.config.settings to run aws s3 sync.
+    Uses credentials from .env via src.config.settings and uploads with boto3.
+    Like `aws s3 sync`, a file is uploaded when it is missing remotely, its size differs,
+    or the local copy is newer.
     """
+    import boto3
+    from boto3.s3.transfer import TransferConfig, create_transfer_manager
+    from botocore.config import Config
+
     # 1. Determine S3 bucket
     # Prefer the bucket from settings, but if it looks like the default and the user said otherwise,
     # we might want to be careful. For now, trusting settings or allowing an override arg would match best practices.
     # However, based on the user's command 's3://beyondu-data/raw/', we should ensure we target that if settings differs.
-    
+
     bucket_name = settings.aws_s3_bucket
     # Basic check: if settings has the default "beyondu-raw-data" but user used "beyondu-data",
     # we might warn, but let's assume .env is correct for now.
-    
+
     # We will use the user's specific target if provided in args, else settings.
     if len(sys.argv) > 1:
         target_s3_uri = sys.argv[1]
@@ -42,38 +111,85 @@ def sync_to_s3():
         print(f"Error: Local directory '{local_dir}' does not exist.")
         return
 
-    # 2. Prepare Environment with Credentials
-    env = os.environ.copy()
-    
-    # Inject credentials from settings if available
+    # 2. Compare against the manifest of the last sync; unchanged files need no S3 request at all
+    local = {rel: (st.st_size, st.st_mtime) for rel, st in iter_local_files(local_dir)}
+    manifest = load_manifest(MANIFEST_PATH, target_s3_uri)
+    candidates = [rel for rel, stat in local.items() if manifest.get(rel) != stat]
+
+    if not candidates:
+        print(f"\nNo changes since last sync ({len(local)} file(s) in manifest)")
+        return
+
+    # 3. Prepare client with credentials
+    session_kwargs = {}
+    # Use credentials from settings if available (else boto3's default chain)
     if settings.aws_access_key_id:
-        env["AWS_ACCESS_KEY_ID"] = settings.aws_access_key_id
+        session_kwargs["aws_access_key_id"] = settings.aws_access_key_id
         print("  [+] AWS_ACCESS_KEY_ID found in settings")
     else:
         print("  [!] AWS_ACCESS_KEY_ID NOT found in settings")
 
     if settings.aws_secret_access_key:
-        env["AWS_SECRET_ACCESS_KEY"] = settings.aws_secret_access_key
+        session_kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
         print("  [+] AWS_SECRET_ACCESS_KEY found in settings")
     else:
          print("  [!] AWS_SECRET_ACCESS_KEY NOT found in settings")
 
     if settings.aws_region:
-        env["AWS_DEFAULT_REGION"] = settings.aws_region
+        session_kwargs["region_name"] = settings.aws_region
 
-    # 3. Run AWS CLI command
-    cmd = ["aws", "s3", "sync", str(local_dir), target_s3_uri]
-    
-    print(f"\nExecuting: {' '.join(cmd)}")
-    try:
-        subprocess.run(cmd, env=env, check=True)
-        print("\n✅ Sync completed successfully.")
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Sync failed with exit code {e.returncode}")
-        sys.exit(e.returncode)
-    except FileNotFoundError:
-        print("\n❌ Error: 'aws' command not found. Please ensure AWS CLI is installed and in PATH.")
+    # One connection per transfer thread, so the pool never discards connections
+    client = boto3.session.Session(**session_kwargs).client(
+        "s3", config=Config(max_pool_connections=UPLOAD_CONCURRENCY)
+    )
+    transfer_config = TransferConfig(
+        multipart_threshold=64 << 20,
+        multipart_chunksize=16 << 20,
+        max_concurrency=UPLOAD_CONCURRENCY,
+        use_threads=True,
+    )
+
+    # 4. Diff the changed files against one listing of the remote prefix
+    bucket, prefix = parse_s3_uri(target_s3_uri)
+    remote = list_remote_objects(client, bucket, prefix)
+
+    to_upload = []
+    for rel in candidates:
+        size, mtime = local[rel]
+        remote_stat = remote.get(prefix + rel)
+        if remote_stat and remote_stat[0] == size and remote_stat[1] >= mtime:
+            continue
+        to_upload.append(rel)
+
+    print(f"\n{len(to_upload)} file(s) to upload, {len(remote)} object(s) already in {target_s3_uri}")
+
+    # 5. Upload changed files through one shared TransferManager (single thread pool for all
+    # files and their multipart parts)
+    failed = set()
+    with create_transfer_manager(client, transfer_config) as manager:
+        futures = {
+            rel: manager.upload(str(local_dir / rel), bucket, prefix + rel)
+            for rel in to_upload
+        }
+        for rel, future in futures.items():
+            try:
+                future.result()
+                print(f"  upload: {rel} -> s3://{bucket}/{prefix}{rel}")
+            except Exception as e:
+                failed.add(rel)
+                print(f"  ❌ failed: {rel}: {e}")
+
+    # 6. Record everything now in sync so the next run can skip it
+    save_manifest(
+        MANIFEST_PATH,
+        target_s3_uri,
+        {rel: stat for rel, stat in local.items() if rel not in failed},
+    )
+
+    if failed:
+        print(f"\n❌ Sync failed for {len(failed)} file(s)")
         sys.exit(1)
+    print("\n✅ Sync completed successfully.")
 
 if __name__ == "__main__":
     sync_to_s3()
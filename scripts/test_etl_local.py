@@ -9,6 +9,7 @@ Docker 없이 빠르게 테스트할 수 있음.
 
 import sys
 import io
+from collections import defaultdict
 from pathlib import Path
 
 # Windows 콘솔 UTF-8 설정
@@ -23,6 +24,7 @@ from sqlalchemy.orm import sessionmaker
 from src.extract.excel_reader import ExcelReader
 from src.load.models import Base, LanguageScore, University
 from src.load.database import DatabaseLoader
+from src.utils import list_xlsx
 from src.transform.parser import LanguageParser, get_score_label
 
 
@@ -45,7 +47,7 @@ def main():
 
     # 샘플 엑셀 파일 찾기
     data_dir = Path(__file__).parent.parent / "data" / "raw"
-    excel_files = list(data_dir.glob("*.xlsx"))
+    excel_files = list_xlsx(data_dir) if data_dir.is_dir() else []
 
     if not excel_files:
         print("[ERROR] 엑셀 파일을 찾을 수 없습니다.")
@@ -97,48 +99,36 @@ def main():
 
     if universities:
         # 지역별 통계
-        region_counts = {}
-        for u in universities:
-            region_counts[u.region] = region_counts.get(u.region, 0) + 1
-
         print(f"\n[지역별 대학 수]")
-        for region, count in sorted(region_counts.items(), key=lambda x: -x[1]):
+        for region, count in loader.count_by(University.region):
             print(f"  {region}: {count}")
 
         # 국가별 통계 (상위 5개)
-        country_counts = {}
-        for u in universities:
-            country_counts[u.country] = country_counts.get(u.country, 0) + 1
-
         print(f"\n[국가별 대학 수 (상위 5개)]")
-        for country, count in sorted(country_counts.items(), key=lambda x: -x[1])[:5]:
+        for country, count in loader.count_by(University.country, limit=5):
             print(f"  {country}: {count}")
 
     if scores:
         # 시험 종류별 통계
-        test_type_counts = {}
-        for s in scores:
-            test_type_counts[s.test_type] = test_type_counts.get(s.test_type, 0) + 1
-
         print(f"\n[시험 종류별 레코드 수]")
-        for test_type, count in sorted(test_type_counts.items(), key=lambda x: -x[1]):
+        for test_type, count in loader.count_by(LanguageScore.test_type):
             print(f"  {test_type}: {count}")
 
         # 등급 코드별 통계
-        code_counts = {}
-        for s in scores:
-            code = s.standard_code or "직접입력"
-            code_counts[code] = code_counts.get(code, 0) + 1
-
         print(f"\n[등급 코드별 레코드 수]")
-        for code, count in sorted(code_counts.items(), key=lambda x: -x[1])[:10]:
-            print(f"  {code}: {count}")
+        for code, count in loader.count_by(LanguageScore.standard_code, limit=10):
+            print(f"  {code or '직접입력'}: {count}")
 
     # 샘플 대학 상세 정보 출력
     print(f"\n{'='*70}")
     print(f" 샘플 대학 상세 정보 (처음 3개)")
     print(f"{'='*70}")
 
+    # 대학별 어학 점수 인덱스 (대학마다 scores 전체를 훑지 않도록)
+    scores_by_uni = defaultdict(list)
+    for s in scores:
+        scores_by_uni[s.university_id].append(s)
+
     for u in universities[:3]:
         print(f"\n[{u.university_id}] {u.name_kr}")
         print(f"  일련번호: {u.serial_number}")
@@ -148,7 +138,7 @@ def main():
         print(f"  최소학점: {u.min_gpa or '-'}")
 
         # 해당 대학의 어학 점수
-        uni_scores = [s for s in scores if s.university_id == u.university_id]
+        uni_scores = scores_by_uni.get(u.university_id, [])
         if uni_scores:
             print(f"  어학 점수 ({len(uni_scores)}개):")
             for s in uni_scores:
@@ -19,6 +19,7 @@
 import argparse
 import sys
 import io
+from collections import defaultdict
 from pathlib import Path
 from urllib.parse import quote_plus
 
@@ -34,6 +35,7 @@ from sqlalchemy import create_engine, text
 from src.extract.excel_reader import ExcelReader
 from src.load.models import University, LanguageRequirement
 from src.load.database import DatabaseLoader
+from src.utils import list_xlsx
 
 
 def format_requirement_label(req: LanguageRequirement) -> str:
@@ -48,8 +50,22 @@ def format_requirement_label(req: LanguageRequirement) -> str:
     return " ".join(parts)
 
 
+# 드라이버 이름 -> SQLAlchemy dialect
+_DRIVER_DIALECTS = {
+    "mysqlclient": "mysqldb",
+    "pymysql": "pymysql",
+    "mysql-connector-python": "mysqlconnector",
+}
+
+
 def check_mysql_driver():
-    """MySQL 드라이버 확인."""
+    """MySQL 드라이버 확인 (C 확장인 mysqlclient 우선)."""
+    try:
+        import MySQLdb
+        return "mysqlclient"
+    except ImportError:
+        pass
+
     try:
         import pymysql
         return "pymysql"
@@ -65,18 +81,20 @@ def check_mysql_driver():
     return None
 
 
+# 드라이버 확인은 한 번만 (모듈 로드 시)
+_MYSQL_DRIVER = check_mysql_driver()
+
+
 def create_database_if_not_exists(
     user: str, password: str, host: str, port: int, database: str
 ):
     """데이터베이스가 없으면 생성."""
-    driver = check_mysql_driver()
+    driver = _MYSQL_DRIVER
     # 비밀번호의 특수문자를 URL 인코딩
     encoded_password = quote_plus(password) if password else ""
 
-    if driver == "pymysql":
-        base_url = f"mysql+pymysql://{user}:{encoded_password}@{host}:{port}/"
-    else:
-        base_url = f"mysql+mysqlconnector://{user}:{encoded_password}@{host}:{port}/"
+    dialect = _DRIVER_DIALECTS.get(driver, "mysqlconnector")
+    base_url = f"mysql+{dialect}://{user}:{encoded_password}@{host}:{port}/"
 
     engine = create_engine(base_url, isolation_level="AUTOCOMMIT")
     with engine.connect() as conn:
@@ -110,10 +128,12 @@ def main():
     print("=" * 70)
 
     # MySQL 드라이버 확인
-    driver = check_mysql_driver()
+    driver = _MYSQL_DRIVER
     if not driver:
         print("\n[ERROR] MySQL 드라이버가 설치되지 않았습니다.")
         print("다음 명령어로 설치하세요:")
+        print("  pip install mysqlclient  (권장, C 확장)")
+        print("  또는")
         print("  pip install pymysql")
         print("  또는")
         print("  pip install mysql-connector-python")
@@ -125,10 +145,8 @@ def main():
     encoded_password = quote_plus(args.password) if args.password else ""
     password_part = f":{encoded_password}" if args.password else ""
 
-    if driver == "pymysql":
-        database_url = f"mysql+pymysql://{args.user}{password_part}@{args.host}:{args.port}/{args.database}?charset=utf8mb4"
-    else:
-        database_url = f"mysql+mysqlconnector://{args.user}{password_part}@{args.host}:{args.port}/{args.database}?charset=utf8mb4"
+    dialect = _DRIVER_DIALECTS[driver]
+    database_url = f"mysql+{dialect}://{args.user}{password_part}@{args.host}:{args.port}/{args.database}?charset=utf8mb4"
 
     print(
         f"[INFO] 연결 URL: mysql://{args.user}:****@{args.host}:{args.port}/{args.database}"
@@ -165,7 +183,7 @@ def main():
 
     # 샘플 엑셀 파일 찾기
     data_dir = Path(__file__).parent.parent / "data" / "raw"
-    excel_files = list(data_dir.glob("*.xlsx"))
+    excel_files = list_xlsx(data_dir) if data_dir.is_dir() else []
 
     if not excel_files:
         print("\n[ERROR] 엑셀 파일을 찾을 수 없습니다.")
@@ -223,33 +241,21 @@ def main():
 
     if universities:
         # 지역별 통계
-        region_counts = {}
-        for u in universities:
-            region_counts[u.region] = region_counts.get(u.region, 0) + 1
-
         print(f"\n[지역별 대학 수]")
-        for region, count in sorted(region_counts.items(), key=lambda x: -x[1])[:6]:
+        for region, count in loader.count_by(University.region, limit=6):
             if region:
                 print(f"  {region}: {count}")
 
         # 국가별 통계 (상위 5개)
-        country_counts = {}
-        for u in universities:
-            country_counts[u.nation] = country_counts.get(u.nation, 0) + 1
-
         print(f"\n[국가별 대학 수 (상위 5개)]")
-        for country, count in sorted(country_counts.items(), key=lambda x: -x[1])[:5]:
+        for country, count in loader.count_by(University.nation, limit=5):
             if country:
                 print(f"  {country}: {count}")
 
     if requirements:
         # 시험 종류별 통계
-        test_type_counts = {}
-        for r in requirements:
-            test_type_counts[r.exam_type] = test_type_counts.get(r.exam_type, 0) + 1
-
         print(f"\n[시험 종류별 요건 수]")
-        for test_type, count in sorted(test_type_counts.items(), key=lambda x: -x[1]):
+        for test_type, count in loader.count_by(LanguageRequirement.exam_type):
             print(f"  {test_type}: {count}")
 
     # 샘플 대학 상세 정보 출력
@@ -262,6 +268,11 @@ def main():
         u for u in universities if u.serial_number and u.serial_number.startswith("E")
     ][:3]
 
+    # 대학별 어학 요건 인덱스 (대학마다 requirements 전체를 훑지 않도록)
+    reqs_by_uni = defaultdict(list)
+    for r in requirements:
+        reqs_by_uni[r.university_id].append(r)
+
     for u in real_universities:
         print(f"\n[{u.id}] {u.name_kor}")
         print(f"  일련번호: {u.serial_number}")
@@ -279,7 +290,7 @@ def main():
         print(f"  최소학점: {u.min_gpa or '-'}")
 
         # 해당 대학의 어학 요건
-        uni_reqs = [r for r in requirements if r.university_id == u.id]
+        uni_reqs = reqs_by_uni.get(u.id, [])
         if uni_reqs:
             print(f"  파싱된 어학 요건 ({len(uni_reqs)}개):")
             for r in uni_reqs:
@@ -5,22 +5,35 @@ import json
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.extract.excel_reader import ExcelReader
+from src.extract.excel_reader import _HAS_CALAMINE, ExcelReader
+
+HEADER_SCAN_ROWS = 50
+
+def read_top_rows(file_path, max_rows=HEADER_SCAN_ROWS):
+    """Read only the header region of the active sheet; uses python-calamine (Rust) when installed, else openpyxl."""
+    if _HAS_CALAMINE:
+        from python_calamine import CalamineWorkbook
+
+        with CalamineWorkbook.from_path(str(file_path)) as wb:
+            # Same restriction as ExcelReader: calamine can't tell which sheet is active
+            if len(wb.sheet_names) == 1:
+                # skip_empty_area=False keeps row indices aligned with the sheet (same as openpyxl)
+                return wb.get_sheet_by_index(0).to_python(skip_empty_area=False, nrows=max_rows)
+
+    from openpyxl import load_workbook
+    # read_only + values_only streams raw tuples instead of building Cell objects
+    wb = load_workbook(file_path, data_only=True, read_only=True)
+    sheet = wb.active
+    # max_row bounds the scan to the header region regardless of workbook size
+    data = [list(row) for row in sheet.iter_rows(values_only=True, max_row=max_rows)]
+    wb.close()
+    return data
 
 def main():
     file_path = Path('data/raw/2026-2 교환학생 파견가능대학 및 지원자격(1차).xlsx')
     reader = ExcelReader(file_path)
     
-    from openpyxl import load_workbook
-    wb = load_workbook(file_path, data_only=True)
-    sheet = wb.active
-
-    data = []
-    for row in sheet.rows:
-        row_data = []
-        for cell in row:
-            row_data.append(cell.value)
-        data.append(row_data)
+    data = read_top_rows(file_path)
 
     header_idx = reader._find_header_row(data)
     with open('headers.json', 'w', encoding='utf-8') as f:
@@ -3,14 +3,13 @@ from pathlib import Path
 import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from src.extract.excel_reader import ExcelReader
+from src.extract import read_excel_cached
 from src.transform.cleaner import DataCleaner
 from src.transform.parser import GPAParser
 
 def main():
     file_path = Path('data/raw/2026-2 교환학생 파견가능대학 및 지원자격(1차).xlsx')
-    reader = ExcelReader(file_path)
-    df = reader.read()
+    df = read_excel_cached(file_path)
     
     cleaner = DataCleaner(df)
     df_clean = cleaner.clean()
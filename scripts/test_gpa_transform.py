@@ -1,31 +1,33 @@
+import re
 import sys
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.extract.excel_reader import ExcelReader
+from src.extract import read_excel_cached
 from src.transform.cleaner import DataCleaner
 import pandas as pd
 
 def check_gpa(file_name, target_unis):
     file_path = Path('data/raw') / file_name
-    reader = ExcelReader(file_path)
-    df = reader.read()
+    df = read_excel_cached(file_path)
     
+    pattern = re.compile('|'.join(map(re.escape, target_unis)), re.IGNORECASE)
+
     # 1. Before Cleaner
     print(f"\n--- {file_name} (Before Cleaner) ---")
-    idx = df['name_eng'].str.contains('|'.join(target_unis), na=False, case=False)
-    for _, row in df[idx][['name_eng', 'min_gpa']].iterrows():
-        print(row.to_dict())
+    mask = df['name_eng'].str.contains(pattern, na=False)
+    for record in df.loc[mask, ['name_eng', 'min_gpa']].to_dict(orient='records'):
+        print(record)
         
     # 2. After Cleaner
     print(f"\n--- {file_name} (After Cleaner) ---")
     cleaner = DataCleaner(df)
     df_clean = cleaner.clean()
-    idx_clean = df_clean['name_eng'].str.contains('|'.join(target_unis), na=False, case=False)
-    for _, row in df_clean[idx_clean][['name_eng', 'min_gpa']].iterrows():
-        print(row.to_dict())
+    mask_clean = df_clean['name_eng'].str.contains(pattern, na=False)
+    for record in df_clean.loc[mask_clean, ['name_eng', 'min_gpa']].to_dict(orient='records'):
+        print(record)
 
 def main():
     targets = ['Black Hills', 'Colorado State University, Pueblo', 'Minnesota']
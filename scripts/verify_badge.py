@@ -7,11 +7,12 @@ sys.path.append(str(project_root))
 
 from src.extract.excel_reader import ExcelReader
 from src.load.models import University # Just to check field existence
+from src.utils import list_xlsx
 
 def verify_badge_extraction():
     # Use the latest file
     data_dir = project_root / "data" / "raw"
-    files = sorted([f for f in data_dir.glob("*.xlsx") if not f.name.startswith("~$")])
+    files = list_xlsx(data_dir) if data_dir.is_dir() else []
     if not files:
         print("No Excel files found in data/raw")
         return
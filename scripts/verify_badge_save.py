@@ -7,12 +7,12 @@ import pandas as pd
 project_root = Path(__file__).resolve().parent.parent
 sys.path.append(str(project_root))
 
-from src.load.database import DatabaseLoader
+from src.load.database import get_loader
 from src.load.models import University
 from sqlalchemy import select
 
 def verify_badge_save():
-    loader = DatabaseLoader()
+    loader = get_loader()
     
     # 1. Create a dummy DataFrame simulating Excel input with 'Badge' column
     data = {
@@ -4,12 +4,11 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.load.database import DatabaseLoader
-import pandas as pd
-from sqlalchemy import create_engine
+from src.load.database import get_loader
+from src.utils import format_table
 
 def main():
-    loader = DatabaseLoader()
+    loader = get_loader()
     engine = loader.engine
     
     query = """
@@ -22,10 +21,6 @@ def main():
     LIMIT 10;
     """
     
-    df = pd.read_sql(query, engine)
-    print("Database Query Results:")
-    print(df.to_string())
-    
     # Let's count how many have min_gpa > 5 and how many have remark
     count_query = """
     SELECT 
@@ -33,9 +28,17 @@ def main():
         SUM(CASE WHEN remark IS NOT NULL AND remark != '' THEN 1 ELSE 0 END) as non_empty_remark_count
     FROM university;
     """
-    counts = pd.read_sql(count_query, engine)
-    print("\nSummary Counts:")
-    print(counts.to_string())
+
+    # Straight to the driver; no DataFrame needed just to print a few rows
+    with engine.connect() as conn:
+        result = conn.exec_driver_sql(query)
+        print("Database Query Results:")
+        print(format_table(list(result.keys()), result.fetchall()))
+
+        weird_gpa_count, non_empty_remark_count = conn.exec_driver_sql(count_query).one()
+        print("\nSummary Counts:")
+        print(f"weird_gpa_count: {weird_gpa_count}")
+        print(f"non_empty_remark_count: {non_empty_remark_count}")
 
 if __name__ == "__main__":
     main()
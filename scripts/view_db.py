@@ -8,6 +8,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import select
+from sqlalchemy.orm import load_only, selectinload
 from src.load.database import DatabaseLoader
 from src.load.models import University
 
@@ -27,20 +28,37 @@ def main():
     loader = DatabaseLoader()
     
     with loader.SessionLocal() as session:
-        # Fetch universities with a limit
-        stmt = select(University).order_by(University.name_kor).limit(args.limit)
-        universities = session.execute(stmt).scalars().all()
-
-        if not universities:
-            print("No universities found in the database.")
-            print("Run the ETL script first: python scripts/run_etl.py --drop-db --init-db")
-            return
-
-        print(f"--- Showing Top {len(universities)} Universities ---")
+        # Fetch universities with a limit; requirements come in one IN query per batch (no N+1),
+        # and yield_per streams the rows in batches instead of materialising them all
+        stmt = (
+            select(University)
+            .order_by(University.name_kor)
+            .limit(args.limit)
+            .options(
+                # Only the printed columns; skips the wide TEXT ones (remark, available_majors, ...)
+                load_only(
+                    University.name_kor,
+                    University.nation,
+                    University.min_gpa,
+                    University.semester,
+                    University.is_exchange,
+                    University.is_visit,
+                    University.language_score,
+                ),
+                selectinload(University.language_requirements),
+            )
+            .execution_options(yield_per=100)
+        )
+        universities = session.execute(stmt).scalars()
 
+        i = -1
         for i, uni in enumerate(universities):
+            if i == 0:
+                # Rows are streamed, so the real count is only known at the end (see footer)
+                print(f"--- Showing Top Universities (limit {args.limit}) ---")
+
             gpa = f"GPA: {uni.min_gpa}" if uni.min_gpa else "GPA: N/A"
-            semesters = f"Semesters: {uni.available_semester}" if uni.available_semester else ""
+            semesters = f"Semesters: {uni.semester}" if uni.semester else ""
             program_types = []
             if uni.is_exchange:
                 program_types.append("Exchange")
@@ -51,11 +69,11 @@ def main():
             print(f"\n[{i+1}] {uni.name_kor} ({uni.nation}) - {gpa} [{program_str}] {semesters}")
             
             # Print the raw language requirement text
-            if uni.language_requirement_text:
-                print(f"  Raw Text: {uni.language_requirement_text}")
+            if uni.language_score:
+                print(f"  Raw Text: {uni.language_score}")
 
-            # Fetch and display language requirements for each university
-            requirements = loader.get_language_requirements(uni.id)
+            # Display the language requirements loaded with the university
+            requirements = uni.language_requirements
             if requirements:
                 print("  Parsed Requirements:")
                 for req in requirements:
@@ -64,6 +82,13 @@ def main():
             else:
                 print("  Parsed Requirements: Not specified or waived.")
 
+        if i < 0:
+            print("No universities found in the database.")
+            print("Run the ETL script first: python scripts/run_etl.py --drop-db --init-db")
+            return
+
+        print(f"\n--- Showed {i + 1} Universities ---")
+
     if output_file:
         output_file.close()
 
@@ -1,5 +1,6 @@
 """Extract module - Read data from Excel files."""
 
+from .cache import read_excel_cached
 from .excel_reader import ExcelReader
 
-__all__ = ["ExcelReader"]
+__all__ = ["ExcelReader", "read_excel_cached"]
@@ -0,0 +1,49 @@
+"""On-disk cache for parsed Excel DataFrames."""
+
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .excel_reader import ExcelReader
+
+DEFAULT_CACHE_DIR = Path("data/.cache")
+
+# Bump when ExcelReader.read() output changes so stale entries are ignored
+_CACHE_VERSION = 2
+
+
+def _stamp(file_path: Path) -> str:
+    st = file_path.stat()
+    return f"{file_path.resolve()}|{st.st_mtime_ns}|{st.st_size}"
+
+
+def _cache_key(file_path: Path) -> str:
+    raw = f"{_CACHE_VERSION}|{_stamp(file_path)}"
+    # 2023 files may take their regions from a reference workbook (see ExcelReader.read)
+    if "2023" in file_path.name:
+        ref_file = ExcelReader._region_reference_file(file_path.parent)
+        if ref_file is not None:
+            raw += f"|{_stamp(ref_file)}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def read_excel_cached(file_path: Path, cache_dir: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Return ExcelReader(file_path).read(), cached on disk keyed by (path, mtime, size) of the
+    file and, for 2023 files, of the region reference workbook.
+    A cache hit skips the openpyxl parse entirely.
+    """
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    cache_file = cache_dir / f"{_cache_key(file_path)}.pkl"
+    if cache_file.exists():
+        return pd.read_pickle(cache_file)
+
+    df = ExcelReader(file_path).read()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    df.to_pickle(cache_file)
+    return df
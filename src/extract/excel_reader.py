@@ -1,18 +1,56 @@
 """Excel file reader with merged cell handling and multi-format support."""
 
+import importlib.util
+import json
 import re
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 from openpyxl import load_workbook
-from openpyxl.cell.cell import MergedCell
+
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+_HAS_CALAMINE = importlib.util.find_spec("python_calamine") is not None
+
+# Semester prefix such as "2023-1", "2023-여름" in the file name
+_SEMESTER_AT_START_RE = re.compile(r"^(\d{4})[-_](\d|여름|겨울)")
+_SEMESTER_ANYWHERE_RE = re.compile(r"(\d{4})[-_](\d|여름|겨울)")
+
+
+def _from_calamine(value: Any) -> Any:
+    """Convert a python-calamine cell value to what openpyxl (data_only) would return."""
+    if isinstance(value, str):
+        return value if value else None  # calamine reports empty cells as ""
+    if type(value) is float and value.is_integer():
+        return int(value)  # openpyxl returns int for integral numbers
+    if type(value) is date:
+        return datetime(value.year, value.month, value.day)  # openpyxl returns datetime for dates
+    return value
+
+
+@lru_cache(maxsize=256)
+def _parse_semester(filename: str) -> str:
+    """Semester ("2024-1", "2023-여름", ...) from a file name; cached since it only depends on the name."""
+    # Support "2023-1", "2023-여름", etc. at the start of filename
+    semester_match = _SEMESTER_AT_START_RE.search(filename)
+    if not semester_match:
+        # Try finding pattern anywhere
+        semester_match = _SEMESTER_ANYWHERE_RE.search(filename)
+
+    return f"{semester_match.group(1)}-{semester_match.group(2)}" if semester_match else "Unknown"
 
 
 class ExcelReader:
     """Read and extract data from university exchange program Excel files."""
 
     _region_mapping_cache: Dict[str, str] = {}
+    # nation -> region cache written by _get_region_mapping, next to read_excel_cached's pickles
+    REGION_MAP_FILE = Path("data/.cache/region_map.json")
 
     # Column mapping configuration
     COLUMN_MAPPING = {
@@ -56,27 +94,23 @@ class ExcelReader:
         "프로그램 구분": "program_type",
     }
 
+    # Derived lookups, computed once at import instead of per column / per call
+    # Lowercased keys so "WEBSITE" / "university name" map like the header check (which is case-insensitive)
+    _NORM_MAPPING = {key.lower(): val for key, val in COLUMN_MAPPING.items()}
+    # Longest key first so the first substring hit is the most specific one (stable for equal lengths)
+    _MAPPING_BY_KEY_LENGTH = tuple(sorted(_NORM_MAPPING.items(), key=lambda kv: len(kv[0]), reverse=True))
+    # Any COLUMN_MAPPING key (uppercased) marks a header row; one regex pass instead of a scan per key
+    _HEADER_RE = re.compile("|".join(re.escape(key.upper()) for key in COLUMN_MAPPING))
+
     def __init__(self, file_path: Path):
         self.file_path = file_path
-        self._workbook = None
 
     def read(self) -> pd.DataFrame:
         """Read the Excel file and return a cleaned DataFrame."""
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
-        wb = load_workbook(self.file_path, data_only=True)
-        self._workbook = wb
-        sheet = wb.active
-
-        data = []
-        for row in sheet.rows:
-            row_data = []
-            for cell in row:
-                if isinstance(cell, MergedCell):
-                    pass
-                row_data.append(cell.value)
-            data.append(row_data)
+        data = self._read_rows()
 
         # 1. Find header row
         header_idx = self._find_header_row(data)
@@ -96,37 +130,25 @@ class ExcelReader:
         # 3. Rename columns using mapping
         rename_dict = {}
         for col in df.columns:
-            col_clean = str(col).strip().replace("\n", " ")
-
-            # Check exact match
-            if col_clean in self.COLUMN_MAPPING:
-                rename_dict[col] = self.COLUMN_MAPPING[col_clean]
-                continue
-
-            # Check if any key is a substring
-            matches = []
-            for key, val in self.COLUMN_MAPPING.items():
-                if key in col_clean:
-                    matches.append((key, val))
-
-            if matches:
-                # Sort by key length descending to match longest key first
-                matches.sort(key=lambda x: len(x[0]), reverse=True)
-                rename_dict[col] = matches[0][1]
+            mapped = self._map_column(str(col).strip().replace("\n", " "))
+            if mapped is not None:
+                rename_dict[col] = mapped
 
         df = df.rename(columns=rename_dict)
 
         # Deduplicate columns to avoid AttributeError in DataCleaner
-        new_cols = []
-        counts: Dict[str, int] = {}
-        for col in df.columns:
-            if col in counts:
-                counts[col] += 1
-                new_cols.append(f"{col}_{counts[col]}")
-            else:
-                counts[col] = 0
-                new_cols.append(col)
-        df.columns = new_cols
+        # (is_unique is a cached hash check, so sheets without repeats skip the rebuild)
+        if not df.columns.is_unique:
+            new_cols = []
+            counts: Dict[str, int] = {}
+            for col in df.columns:
+                if col in counts:
+                    counts[col] += 1
+                    new_cols.append(f"{col}_{counts[col]}")
+                else:
+                    counts[col] = 0
+                    new_cols.append(col)
+            df.columns = new_cols
 
         # The global df.ffill() was removed because it maliciously fills min_gpa and other fields.
         # We only need to forward fill specific structural columns, which is handled in DataCleaner.
@@ -139,26 +161,107 @@ class ExcelReader:
 
         return df
 
+    def _read_rows(self) -> List[List[Any]]:
+        """Read the active sheet as lists of raw cell values.
+
+        Merged cells read as None (only the top-left cell holds the value);
+        DataCleaner forward-fills the structural columns.
+        """
+        if _HAS_CALAMINE:
+            from python_calamine import CalamineError, CalamineWorkbook
+
+            # Rust parser, several times faster than openpyxl. Single-sheet workbooks only,
+            # since calamine does not expose which sheet is active
+            try:
+                with CalamineWorkbook.from_path(str(self.file_path)) as wb:
+                    if len(wb.sheet_names) == 1:
+                        rows = wb.get_sheet_by_index(0).to_python(skip_empty_area=False)
+                        return [[_from_calamine(v) for v in row] for row in rows]
+            except CalamineError as e:
+                # Parts calamine can't handle; openpyxl below gets the final say
+                logger.debug(f"calamine failed on {self.file_path.name} ({e}), using openpyxl")
+
+        # read_only streams the sheet XML instead of building the full DOM (styles, Cell objects)
+        wb = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            sheet = wb.active
+            rows = []
+            width = 0
+            for values in sheet.iter_rows(values_only=True):
+                row = list(values)
+                # The sheet dimension often covers formatted-but-empty cells; drop trailing blanks
+                while row and row[-1] is None:
+                    row.pop()
+                width = max(width, len(row))
+                rows.append(row)
+        finally:
+            wb.close()
+
+        while rows and not rows[-1]:
+            rows.pop()
+        # Rectangular again, spanning only the used area (same shape calamine returns)
+        return [row + [None] * (width - len(row)) for row in rows]
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _map_column(cls, col_clean: str) -> Optional[str]:
+        """Normalized name for a raw header; cached since the same headers recur in every file."""
+        col_clean = col_clean.lower()
+
+        # Check exact match
+        if col_clean in cls._NORM_MAPPING:
+            return cls._NORM_MAPPING[col_clean]
+
+        # Check if any key is a substring (longest key first)
+        for key, val in cls._MAPPING_BY_KEY_LENGTH:
+            if key in col_clean:
+                return val
+        return None
+
+    @classmethod
+    def _region_reference_file(cls, data_dir: Path) -> Optional[Path]:
+        """The 2024/2025 workbook whose 'region' column fills in regions for 2023 files."""
+        ref_files = list(data_dir.glob("2024*.xlsx")) + list(data_dir.glob("2025*.xlsx"))
+        ref_files = [f for f in ref_files if not f.name.startswith("~")]
+        return ref_files[-1] if ref_files else None
+
     @classmethod
     def _get_region_mapping(cls, data_dir: Path) -> Dict[str, str]:
         if cls._region_mapping_cache:
             return cls._region_mapping_cache
 
         mapping: Dict[str, str] = {}
-        # Use 2024 or 2025 files as reference containing 'region' column
-        ref_files = list(data_dir.glob("2024*.xlsx")) + list(data_dir.glob("2025*.xlsx"))
-        ref_files = [f for f in ref_files if not f.name.startswith("~")]
+        ref_file = cls._region_reference_file(data_dir)
 
-        if ref_files:
+        if ref_file is not None:
+            # JSON sidecar so a fresh process (e.g. each run_etl worker) skips re-reading the reference workbook
+            sidecar = cls.REGION_MAP_FILE
+            ref_stamp = {"source": str(ref_file.resolve()), "mtime_ns": ref_file.stat().st_mtime_ns}
             try:
-                reader = cls(ref_files[-1])
-                ref_df = reader.read()
-                if "nation" in ref_df.columns and "region" in ref_df.columns:
-                    valid_rows = ref_df.dropna(subset=["nation", "region"])
-                    mapping = dict(zip(valid_rows["nation"], valid_rows["region"]))
-            except Exception:
+                cached = json.loads(sidecar.read_text(encoding="utf-8"))
+                if cached.get("source") == ref_stamp["source"] and cached.get("mtime_ns") == ref_stamp["mtime_ns"]:
+                    mapping = cached["mapping"]
+            except (OSError, ValueError, KeyError, AttributeError):
                 pass
 
+            if not mapping:
+                try:
+                    reader = cls(ref_file)
+                    ref_df = reader.read()
+                    if "nation" in ref_df.columns and "region" in ref_df.columns:
+                        valid_rows = ref_df.dropna(subset=["nation", "region"])
+                        mapping = dict(zip(valid_rows["nation"], valid_rows["region"]))
+                except Exception:
+                    pass
+
+                # JSON keys are always strings, so only persist mappings that round-trip unchanged
+                if mapping and all(isinstance(k, str) and isinstance(v, str) for k, v in mapping.items()):
+                    try:
+                        sidecar.parent.mkdir(parents=True, exist_ok=True)
+                        sidecar.write_text(json.dumps({**ref_stamp, "mapping": mapping}, ensure_ascii=False), encoding="utf-8")
+                    except OSError:
+                        pass
+
         cls._region_mapping_cache = mapping
         return mapping
 
@@ -167,30 +270,19 @@ class ExcelReader:
         # E.g. "2024-1 교환학생 파견가능대학 및 지원자격(1차).xlsx"
         filename = self.file_path.name
 
-        # Support "2023-1", "2023-여름", etc. at the start of filename
-        semester_match = re.search(r"^(\d{4})[-_](\d|여름|겨울)", filename)
-        if not semester_match:
-             # Try finding pattern anywhere
-             semester_match = re.search(r"(\d{4})[-_](\d|여름|겨울)", filename)
-
-        semester = f"{semester_match.group(1)}-{semester_match.group(2)}" if semester_match else "Unknown"
-
         return {
             "filename": filename,
-            "semester": semester,
+            "semester": _parse_semester(filename),
             "recruitment_round": "Unknown"
         }
 
     def _find_header_row(self, data: List[List[Any]]) -> Union[int, None]:
-        # Use all keys from COLUMN_MAPPING as potential header keywords
-        search_keywords = [key.upper() for key in self.COLUMN_MAPPING.keys()]
-
         for i, row in enumerate(data[:10]):  # Search in the first 10 rows
             # Convert row to a single string for keyword searching
             # Handle newlines in headers for detection
             row_str = " ".join(str(x).upper().replace("\n", " ") for x in row if x is not None and str(x).strip())
 
-            # Check if any search keyword is present in the row string
-            if any(keyword in row_str for keyword in search_keywords):
+            # Check if any COLUMN_MAPPING key is present in the row string
+            if self._HEADER_RE.search(row_str):
                 return i
         return None
@@ -1,6 +1,6 @@
 """Load module - Database operations."""
 
-from .database import DatabaseLoader
+from .database import DatabaseLoader, get_loader
 from .models import Base, LanguageRequirement, University
 
-__all__ = ["DatabaseLoader", "University", "LanguageRequirement", "Base"]
+__all__ = ["DatabaseLoader", "get_loader", "University", "LanguageRequirement", "Base"]
@@ -1,10 +1,14 @@
 """Database operations for loading processed data."""
 
-from typing import Any, Dict, List, Optional
+import importlib.util
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import pandas as pd
-from sqlalchemy import create_engine, delete, select
+from sqlalchemy import create_engine, delete, func, insert, select, tuple_, update
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool, Pool
 
 from src.config import settings
 from src.transform.parser import (
@@ -20,6 +24,22 @@ from .models import Base, LanguageRequirement, University
 
 logger = get_logger(__name__)
 
+# Distinct inputs remembered per parser by each DatabaseLoader
+PARSER_CACHE_SIZE = 4096
+
+
+def _prefer_native_mysql_driver(database_url: str) -> str:
+    """Swap mysql-connector for mysqlclient (C extension, faster row decoding) when it is installed.
+
+    Opt-in through settings.db_prefer_native_mysql: mysqlclient formats parameters with %, so
+    raw SQL written for mysql-connector (e.g. LIKE '%x%' without binds) and connector-specific
+    query arguments do not carry over.
+    """
+    prefix = "mysql+mysqlconnector://"
+    if database_url.startswith(prefix) and importlib.util.find_spec("MySQLdb") is not None:
+        return "mysql+mysqldb://" + database_url[len(prefix):]
+    return database_url
+
 
 class DatabaseLoader:
     """Load processed data into the database."""
@@ -59,18 +79,58 @@ class DatabaseLoader:
         "칠레": "남미",
     }
 
-    def __init__(self, database_url: Optional[str] = None):
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        poolclass: Optional[Type[Pool]] = None,
+    ):
         self.database_url = database_url or settings.database_url
         print(f"DEBUG: DATABASE_URL = {self.database_url}, type = {type(self.database_url)}")
         if not self.database_url or "://" not in self.database_url:
             raise ValueError(f"Invalid DATABASE_URL: {self.database_url}")
-        self.engine = create_engine(self.database_url)
+        engine_url = make_url(
+            _prefer_native_mysql_driver(self.database_url)
+            if settings.db_prefer_native_mysql
+            else self.database_url
+        )
+        backend, driver = engine_url.get_backend_name(), engine_url.get_driver_name()
+
+        # Rows per multi-VALUES INSERT that SQLAlchemy builds from an executemany
+        engine_kwargs: Dict[str, Any] = {"insertmanyvalues_page_size": settings.insert_batch_size}
+        if backend == "postgresql" and driver == "psycopg2":
+            # Also batch the ORM's executemany UPDATEs (psycopg2.extras.execute_batch)
+            engine_kwargs["executemany_mode"] = "values_plus_batch"
+        elif backend == "mssql" and driver == "pyodbc":
+            engine_kwargs["fast_executemany"] = True
+
+        if poolclass is not None:
+            engine_kwargs["poolclass"] = poolclass
+        elif backend != "sqlite":
+            # SQLite's default pools don't take sizing arguments
+            engine_kwargs.update(
+                pool_pre_ping=True,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_use_lifo=settings.db_pool_use_lifo,
+                pool_recycle=settings.db_pool_recycle,
+            )
+        self.engine = create_engine(engine_url, **engine_kwargs)
         self.SessionLocal = sessionmaker(bind=self.engine)
         self._language_parser = LanguageParser()
         self._gpa_parser = GPAParser()
         self._website_url_parser = WebsiteURLParser()
         self._review_parser = ReviewParser()
 
+        # Sheets repeat the same raw strings (review marks, notes, requirement texts) within
+        # and across files, so each parser runs once per distinct input for this loader.
+        # typed=True keeps values that hash equal but parse differently (1 / True) apart;
+        # results are shared between rows and must not be mutated
+        self._parse_review = lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)(self._review_parser.parse)
+        self._parse_exclusions = lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)(self._language_parser.parse_exclusions)
+        self._parse_gpa = lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)(self._gpa_parser.parse)
+        self._parse_website_url = lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)(self._website_url_parser.parse)
+        self._parse_language = lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)(self._language_parser.parse)
+
     def get_region_from_nation(self, nation: str) -> Optional[str]:
         """Get region from nation using the mapping."""
         return self.COUNTRY_TO_REGION_MAP.get(nation)
@@ -83,45 +143,97 @@ class DatabaseLoader:
         """Drop all tables."""
         Base.metadata.drop_all(self.engine)
 
-    def _load_language_requirements(
+    def _build_language_requirements(
         self,
-        session: Session,
         university_id: int,
         parsed_req: ParsedLanguageRequirement,
         excluded_exams_from_note: List[str],
-    ) -> int:
-        """Load parsed language requirements into the database."""
-        session.execute(
-            delete(LanguageRequirement).where(LanguageRequirement.university_id == university_id)
-        )
-        for score_info in parsed_req.scores:
-            record = LanguageRequirement(
-                university_id=university_id,
-                exam_type=score_info.exam_type,
-                min_score=score_info.min_score,
-                level_code=score_info.level_code,
-                language_group=score_info.language_group,
-                is_available=not (
+    ) -> List[Dict[str, Any]]:
+        """Build language_requirement rows (as dicts for a bulk INSERT) from a parsed requirement."""
+        return [
+            {
+                "university_id": university_id,
+                "exam_type": score_info.exam_type,
+                "min_score": score_info.min_score,
+                "level_code": score_info.level_code,
+                "language_group": score_info.language_group,
+                "is_available": not (
                     score_info.exam_type in parsed_req.excluded_tests
                     or score_info.exam_type in excluded_exams_from_note
                 ),
-            )
-            session.add(record)
-        return len(parsed_req.scores)
+            }
+            for score_info in parsed_req.scores
+        ]
+
+    @staticmethod
+    def _merge_semester(current: Optional[str], new_semester: Optional[str]) -> Optional[str]:
+        """Add new_semester to a ', '-joined semester list (newest first)."""
+        if not new_semester:
+            return current
+        semesters = set(current.split(", ")) if current else set()
+        semesters.add(new_semester)
+        return ", ".join(sorted(semesters, reverse=True))
+
+    def _bulk_insert(self, session: Session, model: Type[Base], rows: List[Dict[str, Any]]) -> None:
+        """executemany INSERT in chunks of settings.insert_batch_size rows; the caller commits."""
+        batch_size = settings.insert_batch_size
+        for start in range(0, len(rows), batch_size):
+            session.execute(insert(model), rows[start:start + batch_size])
+
+    def _select_by_keys(self, session: Session, keys: List[Tuple[str, str]], *extra_columns: Any) -> List[Tuple[Any, ...]]:
+        """(id, name_eng, nation, *extra_columns) of universities matching (name_eng, nation) keys.
+
+        Matches the composite key in SQL (served by idx_university_name_eng_nation), chunked
+        by settings.insert_batch_size to stay under bind-parameter limits.
+        """
+        rows: List[Tuple[Any, ...]] = []
+        columns = (University.id, University.name_eng, University.nation, *extra_columns)
+        composite_key = tuple_(University.name_eng, University.nation)
+        batch_size = settings.insert_batch_size
+        for start in range(0, len(keys), batch_size):
+            stmt = select(*columns).where(composite_key.in_(keys[start:start + batch_size]))
+            rows.extend(session.execute(stmt).all())
+        return rows
 
     def load_universities_dataframe(self, df: pd.DataFrame) -> Dict[str, int]:
-        """Load a cleaned DataFrame into the database using an upsert strategy."""
+        """Load a cleaned DataFrame into the database using an upsert strategy.
+
+        Existing universities are updated with one ORM bulk UPDATE by primary key; new
+        universities and all language requirements are written with batched executemany INSERTs.
+        Everything is committed once at the end, so a failed load leaves the tables untouched.
+        """
         stats = {"inserted": 0, "updated": 0, "skipped": 0, "language_reqs": 0}
         with self.SessionLocal() as session:
-            # Use name_eng and nation as a composite key to find existing records
-            eng_names = df.get("name_eng", pd.Series()).dropna().unique()
-            existing_map = {}
-            if len(eng_names) > 0:
-                stmt = select(University).where(University.name_eng.in_(eng_names))
-                for uni in session.execute(stmt).scalars():
-                    existing_map[(uni.name_eng, uni.nation)] = uni
-
-            for _, row in df.iterrows():
+            # Use name_eng and nation as a composite key to find existing records, normalised
+            # with _get_field like the row loop below so padded cells still match
+            key_rows = df.reindex(columns=["name_eng", "nation"]).drop_duplicates().to_dict("records")
+            keys = [
+                key
+                for key in dict.fromkeys(
+                    (self._get_field(row, "name_eng"), self._get_field(row, "nation")) for row in key_rows
+                )
+                if all(key)
+            ]
+            # Only the columns the upsert needs, not full ORM objects
+            existing_ids: Dict[Tuple[str, str], int] = {}
+            existing_semesters: Dict[int, Optional[str]] = {}
+            for uni_id, uni_name_eng, uni_nation, uni_semester in self._select_by_keys(
+                session, keys, University.semester
+            ):
+                existing_ids[(uni_name_eng, uni_nation)] = uni_id
+                existing_semesters[uni_id] = uni_semester
+
+            # university id -> column values to UPDATE
+            pending_updates: Dict[int, Dict[str, Any]] = {}
+            # composite key -> column values of universities to INSERT
+            pending_inserts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+            # composite key -> (parsed requirement or None, exclusions); the last row for a key wins
+            lang_inputs: Dict[Tuple[str, str], Tuple[Optional[ParsedLanguageRequirement], List[str]]] = {}
+
+            # Plain tuples instead of iterrows(), which builds (and dtype-coerces) a Series per row
+            columns = list(df.columns)
+            for values in df.itertuples(index=False, name=None):
+                row = dict(zip(columns, values))
                 name_kor = self._get_field(row, "name_kor")
                 name_eng = self._get_field(row, "name_eng")
                 nation = self._get_field(row, "nation")
@@ -144,12 +256,12 @@ class DatabaseLoader:
                         region = mapped_region
 
                 raw_review_text = self._get_field(row, "review_raw")
-                has_review, review_year = self._review_parser.parse(raw_review_text)
+                has_review, review_year = self._parse_review(raw_review_text)
                 logger.debug(f"ReviewParser input: '{raw_review_text}', Parsed: has_review={has_review}, review_year='{review_year}'")
 
                 # Parse exclusions from significant_note
                 sig_note = self._get_field(row, "significant_note")
-                excluded_exams = self._language_parser.parse_exclusions(sig_note)
+                excluded_exams = self._parse_exclusions(sig_note)
 
                 data = {
                     "semester": new_semester_from_file,
@@ -158,89 +270,92 @@ class DatabaseLoader:
                                     "name_kor": name_kor,
                                     "name_eng": name_eng,
                                     "badge": self._get_field(row, "institution"),
-                                    "min_gpa": self._gpa_parser.parse(self._get_field(row, "min_gpa")) or 0.0,
+                                    "min_gpa": self._parse_gpa(self._get_field(row, "min_gpa")) or 0.0,
                                     "significant_note": self._get_field(row, "significant_note"),
                                     "remark": "\n".join(filter(None, [self._get_field(row, "remark"), self._get_field(row, "remark_ref")])),
                                     "available_majors": self._get_field(row, "available_majors"),
-                                    "website_url": self._website_url_parser.parse(
-                        self._get_field(row, "website_url")
-                    ),
+                                    "website_url": self._parse_website_url(self._get_field(row, "website_url")),
                     "is_exchange": "교환" in program_type_str,
                     "is_visit": "방문" in program_type_str,
                     "has_review": has_review,
                     "review_year": review_year,
                     "language_score": lang_req_parse_text,
-                    "available_semester": self._get_field(row, "available_semester"), # 이 부분은 더 이상 모델에 없음
-
                 }
 
-                # 모델에서 제거된 컬럼이 data에 남아있을 경우 제거
-                if "available_semester" in data:
-                    del data["available_semester"]
-                if "thumbnail_url" in data: # 혹시 모를 경우를 대비하여 추가
-                    del data["thumbnail_url"]
-
                 composite_key = (name_eng, nation)
-                university = existing_map.get(composite_key)
+                university_id = existing_ids.get(composite_key)
+                pending = pending_inserts.get(composite_key)
 
-                if university:  # Update existing university
+                if university_id is not None:  # Update existing university
+                    update_values = pending_updates.setdefault(university_id, {"id": university_id})
                     # Handle cumulative update for semester
                     if new_semester_from_file:
-                        existing_semesters = (
-                            set(university.semester.split(", "))
-                            if university.semester
-                            else set()
-                        )
-                        existing_semesters.add(new_semester_from_file)
-                        data["semester"] = ", ".join(
-                            sorted(list(existing_semesters), reverse=True)
-                        )
-
-                    for key, value in data.items():
-                        setattr(university, key, value)
+                        current_semester = update_values.get("semester", existing_semesters[university_id])
+                        data["semester"] = self._merge_semester(current_semester, new_semester_from_file)
+
+                    update_values.update(data)
+                    stats["updated"] += 1
+                elif pending:  # Seen earlier in this DataFrame, not inserted yet
+                    if new_semester_from_file:
+                        data["semester"] = self._merge_semester(pending["semester"], new_semester_from_file)
+                    pending.update(data)
                     stats["updated"] += 1
                 else:  # Insert new university
-                    university = University(**data)
-                    session.add(university)
+                    pending_inserts[composite_key] = data
                     stats["inserted"] += 1
-                    # Add to map to allow updates within the same dataframe run
-                    existing_map[composite_key] = university
-
-                if university:
-                    # We need the ID for language requirements, so flush to get it
-                    if not university.id:
-                        session.flush()
-
-                    if lang_req_parse_text:
-                        parsed_req = self._language_parser.parse(
-                            lang_req_parse_text, region=university.region
-                        )
-                        if not parsed_req.is_optional and university.id:
-                            count = self._load_language_requirements(
-                                session, university.id, parsed_req, excluded_exams
-                            )
-                            stats["language_reqs"] += count
-                        else:
-                            # If it's optional, clear existing language requirements
-                            session.execute(delete(LanguageRequirement).where(LanguageRequirement.university_id == university.id))
+
+                parsed_req = None
+                if lang_req_parse_text:
+                    parsed_req = self._parse_language(lang_req_parse_text, region)
+                    if parsed_req.is_optional:
+                        parsed_req = None
                     else:
-                        # If there is no language requirement text, clear existing
-                        session.execute(delete(LanguageRequirement).where(LanguageRequirement.university_id == university.id))
+                        stats["language_reqs"] += len(parsed_req.scores)
+                lang_inputs[composite_key] = (parsed_req, excluded_exams)
+
+            # UPDATE ... WHERE id = ? as one executemany (every dict has the same keys)
+            if pending_updates:
+                session.execute(update(University), list(pending_updates.values()))
+
+            # Insert new universities in batches, then read their ids back in one query
+            # (portable: MySQL has no INSERT ... RETURNING)
+            if pending_inserts:
+                self._bulk_insert(session, University, list(pending_inserts.values()))
+                for uni_id, uni_name_eng, uni_nation in self._select_by_keys(session, list(pending_inserts)):
+                    existing_ids.setdefault((uni_name_eng, uni_nation), uni_id)
+
+            # Replace language requirements of every touched university
+            touched_ids = [existing_ids[key] for key in lang_inputs]
+            batch_size = settings.insert_batch_size
+            for start in range(0, len(touched_ids), batch_size):
+                session.execute(
+                    delete(LanguageRequirement).where(
+                        LanguageRequirement.university_id.in_(touched_ids[start:start + batch_size])
+                    )
+                )
+
+            # No parsed requirement (missing or optional) leaves the university with none
+            req_rows: List[Dict[str, Any]] = []
+            for university_id, (parsed_req, excluded_exams) in zip(touched_ids, lang_inputs.values()):
+                if parsed_req is not None:
+                    req_rows.extend(
+                        self._build_language_requirements(university_id, parsed_req, excluded_exams)
+                    )
+            self._bulk_insert(session, LanguageRequirement, req_rows)
 
             session.commit()
 
         return stats
 
-    def _get_field(self, row: pd.Series, field_name: str, default: Any = None) -> Any:
+    def _get_field(self, row: Dict[str, Any], field_name: str, default: Any = None) -> Any:
         value = row.get(field_name)
-        try:
-            import pandas as pd
-            if value is None or pd.isna(value) or (isinstance(value, str) and not value.strip()):
-                return default
-        except ImportError:
-            if value is None or (isinstance(value, str) and not value.strip()):
-                return default
-        return str(value).strip() if isinstance(value, str) else value
+        # Strings are the common case: strip once and skip the pd.isna() call
+        if isinstance(value, str):
+            value = value.strip()
+            return value if value else default
+        if value is None or pd.isna(value):
+            return default
+        return value
 
     def get_all_universities(self) -> List[University]:
         with self.SessionLocal() as session:
@@ -255,6 +370,15 @@ class DatabaseLoader:
         with self.SessionLocal() as session:
             return list(session.execute(select(LanguageRequirement).order_by(LanguageRequirement.university_id, LanguageRequirement.exam_type)).scalars().all())
 
+    def count_by(self, column: Any, limit: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """Count rows per value of a mapped column (e.g. University.region) with GROUP BY, most common first."""
+        count = func.count().label("count")
+        stmt = select(column, count).group_by(column).order_by(count.desc(), column)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        with self.SessionLocal() as session:
+            return [(value, n) for value, n in session.execute(stmt).all()]
+
     def search_universities_by_language(self, exam_type: str, user_score: float) -> List[University]:
         with self.SessionLocal() as session:
             stmt = (
@@ -267,3 +391,12 @@ class DatabaseLoader:
                 .distinct()
             )
             return list(session.execute(stmt).scalars().all())
+
+
+@lru_cache(maxsize=1)
+def get_loader() -> DatabaseLoader:
+    """Return a shared DatabaseLoader for short-lived scripts.
+
+    Uses NullPool since one-shot CLIs gain nothing from keeping connections pooled.
+    """
+    return DatabaseLoader(poolclass=NullPool)
@@ -57,7 +57,7 @@ class LanguageRequirement(Base):
 
     __table_args__ = (
         Index("idx_lang_req_university_id", "university_id"),
-        Index("idx_lang_req_exam_type", "exam_type"),
+        Index("idx_lang_req_exam_score", "exam_type", "min_score"),
     )
 
     def __repr__(self) -> str:
@@ -132,6 +132,7 @@ class University(Base):
         Index("idx_university_nation", "nation"),
         Index("idx_university_region", "region"),
         Index("idx_university_name_kor", "name_kor"),
+        Index("idx_university_name_eng_nation", "name_eng", "nation"),
     )
 
     def __repr__(self) -> str:
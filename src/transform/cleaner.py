@@ -5,12 +5,20 @@ from typing import Optional
 
 import pandas as pd
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_SUMMARY_ROW_RE = re.compile("합계|소계|총계|nan", re.IGNORECASE)
+_GPA_RATIO_RE = re.compile(r"^\d+\.?\d*/\d+\.?\d*$")
+_GPA_AT_LEAST_RE = re.compile(r"(\d+\.?\d*)\s*이상")
+_GPA_NUMBER_RE = re.compile(r"^(\d+\.?\d*)$")
+
 
 class DataCleaner:
     """Clean and normalize extracted Excel data."""
 
     def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
+        # Shallow copy: every step replaces whole columns (df[col] = ...) or re-slices,
+        # which never writes into the caller's arrays, so duplicating the data is unnecessary
+        self.df = df.copy(deep=False)
 
     def clean(self) -> pd.DataFrame:
         """Run all cleaning steps and return cleaned DataFrame."""
@@ -24,22 +32,37 @@ class DataCleaner:
     def _clean_program_type(self) -> None:
         """Clean program type values."""
         if "program_type" in self.df.columns:
-            self.df["program_type"] = self.df["program_type"].apply(
-                lambda x: str(x).strip().replace("\n", "") if pd.notna(x) else x
-            )
+            col = self.df["program_type"]
+            mask = col.notna()
+            if mask.any():
+                cleaned = col[mask].astype(object).astype(str).str.strip().str.replace("\n", "", regex=False)
+                self.df["program_type"] = cleaned.reindex(col.index).where(mask, col)
 
     def _clean_whitespace(self) -> None:
         """Remove extra whitespace from string columns."""
         for col in self.df.columns:
             if self.df[col].dtype == "object":
-                self.df[col] = self.df[col].apply(
-                    lambda x: " ".join(str(x).split()) if pd.notna(x) and str(x).strip() else x
-                )
+                values = self.df[col]
+                mask = values.notna()
+                if not mask.any():
+                    continue
+                # Vectorized " ".join(str(x).split()); whitespace-only cells keep their original value
+                collapsed = values[mask].astype(str).str.replace(_WHITESPACE_RE, " ", regex=True).str.strip()
+                mask &= (collapsed != "").reindex(values.index, fill_value=False)
+                self.df[col] = collapsed.reindex(values.index).where(mask, values)
 
     def _normalize_gpa(self) -> None:
         """Normalize GPA values to consistent format."""
-        if "min_gpa" in self.df.columns:
-            self.df["min_gpa"] = self.df["min_gpa"].apply(self._parse_gpa)
+        if "min_gpa" in self.df.columns and not self.df.empty:
+            col = self.df["min_gpa"]
+            mask = col.notna()
+            # _parse_gpa only depends on str(value), and GPA columns repeat a handful of
+            # values, so parse each distinct string once and map the results back
+            value_strs = col[mask].astype(object).astype(str)
+            parsed = {value: self._parse_gpa(value) for value in value_strs.unique()}
+            normalized = pd.Series([None] * len(col), index=col.index, dtype=object)
+            normalized[mask] = value_strs.map(parsed)
+            self.df["min_gpa"] = normalized
 
     def _parse_gpa(self, value: Optional[str]) -> Optional[str]:
         """Parse GPA value to normalized format."""
@@ -51,16 +74,16 @@ class DataCleaner:
             return None
 
         # Already in X.X/X.X format
-        if re.match(r"^\d+\.?\d*/\d+\.?\d*$", value_str):
+        if _GPA_RATIO_RE.match(value_str):
             return value_str
 
         # "3.0 이상" format
-        match = re.search(r"(\d+\.?\d*)\s*이상", value_str)
+        match = _GPA_AT_LEAST_RE.search(value_str)
         if match:
             return f"{match.group(1)}/4.5"
 
         # Just a number
-        match = re.search(r"^(\d+\.?\d*)$", value_str)
+        match = _GPA_NUMBER_RE.search(value_str)
         if match:
             return f"{match.group(1)}/4.5"
 
@@ -70,9 +93,10 @@ class DataCleaner:
     def _forward_fill_merged_columns(self) -> None:
         """Forward fill columns that typically have merged cells."""
         merge_columns = ["nation", "region", "program_type", "institution"]
-        for col in merge_columns:
-            if col in self.df.columns:
-                self.df[col] = self.df[col].ffill()
+        existing = [col for col in merge_columns if col in self.df.columns]
+        if existing:
+            # One block-wise ffill instead of one call per column
+            self.df[existing] = self.df[existing].ffill()
 
     def _remove_invalid_rows(self) -> None:
         """Remove rows without essential data."""
@@ -82,14 +106,12 @@ class DataCleaner:
         if existing:
             # Remove rows where essential columns are all empty
             mask = self.df[existing].notna().any(axis=1)
-            self.df = self.df[mask].copy()
 
             # Remove summary rows
             if "name_kor" in self.df.columns:
-                self.df = self.df[
-                    ~self.df["name_kor"]
-                    .astype(str)
-                    .str.contains("합계|소계|총계|nan", case=False, na=False)
-                ].copy()
+                mask &= ~self.df["name_kor"].astype(str).str.contains(_SUMMARY_ROW_RE, na=False)
+
+            # One filter for both masks; reset_index already returns a new frame, no .copy() needed
+            self.df = self.df[mask]
 
         self.df = self.df.reset_index(drop=True)
@@ -71,6 +71,20 @@ TEST_TYPE_TO_LANGUAGE_GROUP: Dict[str, str] = { # Added type hint for TEST_TYPE_
     "CILS": "ITALIAN",
 }
 
+# Precompiled patterns (parsers run once per row, so skip re's pattern-cache lookup)
+_EXCLUSION_TARGET_RES = (re.compile("제외"), re.compile("불가"))
+_EXCLUSION_TOKEN_SPLIT_RE = re.compile(r'[,/\s\(\)\[\]]+')
+_HANGUL_RE = re.compile(r'[가-힣]')
+_EU_CODE_RE = re.compile(r'\b(EU_[A-E][1-5])\b')
+_EU_GRADE_RE = re.compile(r'유럽(?:권)?\s*([A-E]-?[1-5])')
+_CN_GRADE_RE = re.compile(r'중국(?:어)?(?:권)?\s*(B-?[1-3])')
+_JP_GRADE_RE = re.compile(r'일본(?:어)?(?:권)?\s*(C-?[1-2])')
+_GENERIC_GRADE_RE = re.compile(r'\b([A-E]-?[1-5])\b')
+_GPA_NUMBER_RE = re.compile(r"(\d+\.?\d*)")
+_URL_RE = re.compile(r"(https?://|www\.)[^\s()\[\]\{\}]+")
+_DOMAIN_RE = re.compile(r"\b[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:[/\?#][^\s()\[\]\{\}]+)?\b")
+_REVIEW_YEAR_RE = re.compile(r"(20\d{2}(?:\s*-\s*20\d{2})?)")
+
 def _cefr_to_float(level_str: str) -> float:
     level_str = level_str.upper().strip()
     mapping = {"B2": 2.0, "B1": 1.0, "A2": 0.5, "A1": 0.25, "C1": 3.0, "C2": 4.0}
@@ -114,6 +128,11 @@ class LanguageParser:
     EXCLUDE_PATTERNS: List[str] = [r"TOEIC[^가-힣]*제외", r"ITP[^가-힣]*제외", r"토익[^가-힣]*제외"] # Added type hint
     OPTIONAL_PATTERNS: List[str] = [r"어학\s*성적?\s*없음", r"면제", r"불필요", r"N/?A"] # Added type hint
 
+    # Compiled forms of the pattern lists above
+    _SCORE_REGEXES = [(re.compile(p, re.IGNORECASE), exam, conv) for p, exam, conv in SCORE_PATTERNS]
+    _EXCLUDE_REGEXES = [re.compile(p, re.IGNORECASE) for p in EXCLUDE_PATTERNS]
+    _OPTIONAL_RE = re.compile("|".join(f"(?:{p})" for p in OPTIONAL_PATTERNS), re.IGNORECASE)
+
     def parse(self, text: Optional[str], region: Optional[str] = None) -> ParsedLanguageRequirement:
         """
         Parse language requirement text using a direct-first, code-fallback strategy.
@@ -134,12 +153,13 @@ class LanguageParser:
         result = ParsedLanguageRequirement(raw_text=text)
         scores_map: Dict[str, ParsedScoreInfo] = {}
 
-        if any(re.search(p, text, re.IGNORECASE) for p in self.OPTIONAL_PATTERNS):
+        if self._OPTIONAL_RE.search(text):
             result.is_optional = True
             return result
 
-        for pattern in self.EXCLUDE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
+        for regex in self._EXCLUDE_REGEXES:
+            if regex.search(text):
+                pattern = regex.pattern
                 if "TOEIC" in pattern or "토익" in pattern:
                     result.excluded_tests.append("TOEIC")
                 if "ITP" in pattern:
@@ -161,10 +181,10 @@ class LanguageParser:
                     )
 
         # Step 2: Direct parsing to override specific scores
-        for pattern, exam_type, converter in self.SCORE_PATTERNS:
+        for regex, exam_type, converter in self._SCORE_REGEXES:
             if exam_type in result.excluded_tests:
                 continue
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+            for match in regex.finditer(text):
                 try:
                     raw_score = match.group(1)
                     if exam_type in ("DELF", "ZD", "DELE", "CELI", "CILS"):
@@ -259,18 +279,16 @@ class LanguageParser:
         # Use the normalized note for extraction (but be careful about indices if we mapped back to original note,
         # but here we just need the tokens)
 
-        targets = ["제외", "불가"]
-
-        for target in targets:
+        for target_re in _EXCLUSION_TARGET_RES:  # "제외", "불가"
             # Find all indices of target in NORMALIZED note
-            for match in re.finditer(target, note_norm):
+            for match in target_re.finditer(note_norm):
                 # Look at the text preceding the match (up to, say, 20-30 chars or previous newline/punctuation)
                 start = max(0, match.start() - 50)
                 prefix = note_norm[start:match.start()]
 
                 # Try to extract exam names from the trailing part of prefix
                 # We tokenize the prefix by common separators
-                tokens = re.split(r'[,/\s\(\)\[\]]+', prefix)
+                tokens = _EXCLUSION_TOKEN_SPLIT_RE.split(prefix)
 
                 # Check tokens in reverse order (closest to "제외" first)
                 # Valid exam names usually contain English letters.
@@ -301,7 +319,7 @@ class LanguageParser:
                         # If we hit a non-exam word (e.g. "어학성적", "단,"), specifically if it's Korean or unrelated English
                         # we should probably stop for this segment to avoid "Eating" too far back.
                         # Heuristic: If it contains Korean, stop.
-                        if re.search(r'[가-힣]', token):
+                        if _HANGUL_RE.search(token):
                             break
                         # If it's a very long word or irrelevant, maybe stop?
                         # For now, simplistic check: if not in KNOWN and not similar, stop.
@@ -320,32 +338,32 @@ class LanguageParser:
         is_europe = '유럽' in region_str or '유럽' in text_upper
 
         # 1. Explicit Europe codes like EU_B2
-        for match in re.finditer(r'\b(EU_[A-E][1-5])\b', text_upper):
+        for match in _EU_CODE_RE.finditer(text_upper):
             if match.group(1) in LANGUAGE_STANDARDS:
                 codes.add(match.group(1))
 
         # 2. Text containing "유럽[무언가]B2" -> EU_B2
-        for match in re.finditer(r'유럽(?:권)?\s*([A-E]-?[1-5])', text_upper):
+        for match in _EU_GRADE_RE.finditer(text_upper):
             grade = match.group(1).replace('-', '')
             code = f"EU_{grade}"
             if code in LANGUAGE_STANDARDS:
                 codes.add(code)
 
         # 3. Explicit Asia codes
-        for match in re.finditer(r'중국(?:어)?(?:권)?\s*(B-?[1-3])', text_upper):
+        for match in _CN_GRADE_RE.finditer(text_upper):
             grade = match.group(1).replace('-', '')
             code = f"CN_{grade}"
             if code in LANGUAGE_STANDARDS:
                 codes.add(code)
 
-        for match in re.finditer(r'일본(?:어)?(?:권)?\s*(C-?[1-2])', text_upper):
+        for match in _JP_GRADE_RE.finditer(text_upper):
             grade = match.group(1).replace('-', '')
             code = f"JP_{grade}"
             if code in LANGUAGE_STANDARDS:
                 codes.add(code)
 
         # 4. Generic letters (A1, B2, C1, B-2)
-        for match in re.finditer(r'\b([A-E]-?[1-5])\b', text_upper):
+        for match in _GENERIC_GRADE_RE.finditer(text_upper):
             raw_grade = match.group(1).replace('-', '')
 
             if raw_grade.startswith('A'):
@@ -386,7 +404,7 @@ class GPAParser:
             return None
 
         # Extracts the first number found, which is assumed to be the GPA.
-        match = re.search(r"(\d+\.?\d*)", text)
+        match = _GPA_NUMBER_RE.search(text)
         if match:
             try:
                 gpa = float(match.group(1))
@@ -414,13 +432,13 @@ class WebsiteURLParser:
 
         # 1. First pass: Look for URLs starting with a protocol or 'www.'
         # This is more reliable. Stops at whitespace or common closing brackets.
-        match = re.search(r"(https?://|www\.)[^\s()\[\]\{\}]+", text_str)
+        match = _URL_RE.search(text_str)
 
         # 2. Second pass: If nothing found, look for domain-like patterns (e.g., example.com)
         if not match:
             # This looks for "word.word" patterns that are likely domains.
             # It avoids matching floating point numbers by requiring a letter in the TLD.
-            match = re.search(r"\b[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:[/\?#][^\s()\[\]\{\}]+)?\b", text_str)
+            match = _DOMAIN_RE.search(text_str)
             if not match:
                 return None
 
@@ -464,7 +482,7 @@ class ReviewParser:
         # 3. If no year, check for positive indicators (Y, O, YES, EXIST, etc.)
 
         # Year pattern: 20xx or 20xx-20xx
-        year_match = re.search(r"(20\d{2}(?:\s*-\s*20\d{2})?)", text_str)
+        year_match = _REVIEW_YEAR_RE.search(text_str)
         if year_match:
             return True, year_match.group(1).strip()
 
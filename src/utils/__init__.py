@@ -1,5 +1,7 @@
 """Utility functions."""
 
+from .files import list_excel_files, list_xlsx
 from .logger import get_logger
+from .table import format_table
 
-__all__ = ["get_logger"]
+__all__ = ["format_table", "get_logger", "list_excel_files", "list_xlsx"]
@@ -0,0 +1,32 @@
+"""Filesystem helpers."""
+
+import os
+from pathlib import Path
+from typing import List, Tuple, Union
+
+EXCEL_SUFFIXES = (".xlsx", ".xls")
+
+
+def _list_files(directory: Union[str, Path], suffixes: Tuple[str, ...]) -> List[Path]:
+    """Single scandir pass: files ending in one of suffixes, sorted by name, without ~$ lock files."""
+    with os.scandir(directory) as entries:
+        return sorted(
+            (
+                Path(entry.path)
+                for entry in entries
+                if entry.name.lower().endswith(suffixes)
+                and not entry.name.startswith("~")
+                and entry.is_file()
+            ),
+            key=lambda p: p.name,
+        )
+
+
+def list_xlsx(directory: Union[str, Path]) -> List[Path]:
+    """List .xlsx files in a directory sorted by name, skipping Excel lock files (~$*)."""
+    return _list_files(directory, (".xlsx",))
+
+
+def list_excel_files(directory: Union[str, Path]) -> List[Path]:
+    """List .xlsx and .xls files in a directory sorted by name, skipping Excel lock files (~$*)."""
+    return _list_files(directory, EXCEL_SUFFIXES)
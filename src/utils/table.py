@@ -0,0 +1,12 @@
+"""Plain-text table formatting for diagnostic scripts."""
+
+from typing import Any, Iterable, List, Sequence
+
+
+def format_table(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+    """Format rows as a whitespace-aligned text table (like DataFrame.to_string, without pandas)."""
+    header = [str(c) for c in columns]
+    body: List[List[str]] = [["" if v is None else str(v) for v in row] for row in rows]
+    widths = [max([len(header[i])] + [len(r[i]) for r in body]) for i in range(len(header))]
+    lines = ["  ".join(cell.ljust(w) for cell, w in zip(line, widths)).rstrip() for line in [header] + body]
+    return "\n".join(lines)
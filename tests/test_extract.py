@@ -2,9 +2,12 @@
 
 from pathlib import Path
 
+import pandas as pd
 import pytest
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
 
+from src.extract import excel_reader, read_excel_cached
 from src.extract.excel_reader import ExcelReader
 
 
@@ -84,9 +87,127 @@ class TestExcelReader:
 
 
 
+    def test_openpyxl_fallback_matches_calamine(
+        self, merged_cell_excel: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without python-calamine the openpyxl path yields the same DataFrame."""
+        pytest.importorskip("python_calamine")
+        # A formatted but empty cell stretches the sheet dimension beyond the data
+        wb = load_workbook(merged_cell_excel)
+        wb.active["F10"].font = Font(bold=True)
+        wb.save(merged_cell_excel)
+        fast = ExcelReader(merged_cell_excel).read()
+
+        monkeypatch.setattr(excel_reader, "_HAS_CALAMINE", False)
+        fallback = ExcelReader(merged_cell_excel).read()
+
+        pd.testing.assert_frame_equal(fast, fallback)
+
+    def test_calamine_error_falls_back_to_openpyxl(
+        self, merged_cell_excel: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A workbook calamine rejects is still read through openpyxl."""
+        calamine = pytest.importorskip("python_calamine")
+        expected = ExcelReader(merged_cell_excel).read()
+
+        def fail(path: str) -> None:
+            raise calamine.CalamineError("unsupported")
+
+        monkeypatch.setattr(calamine.CalamineWorkbook, "from_path", fail)
+        pd.testing.assert_frame_equal(ExcelReader(merged_cell_excel).read(), expected)
+
+    def test_extract_file_metadata_semester(self, tmp_path: Path) -> None:
+        """Semester is taken from the file name prefix, or anywhere in the name."""
+        assert ExcelReader(tmp_path / "2024-1 교환학생(1차).xlsx").extract_file_metadata()["semester"] == "2024-1"
+        assert ExcelReader(tmp_path / "붙임_2023-여름 파견.xlsx").extract_file_metadata()["semester"] == "2023-여름"
+        assert ExcelReader(tmp_path / "list.xlsx").extract_file_metadata()["semester"] == "Unknown"
+
+    def test_map_column_prefers_longest_key(self) -> None:
+        """Exact matches win; otherwise the longest contained key decides."""
+        assert ExcelReader._map_column("국가") == "nation"
+        assert ExcelReader._map_column("지원 자격 어학성적 (TOEFL)") == "language_requirement"
+        assert ExcelReader._map_column("교환학생수기 여부(Y/N)") == "review_raw"
+        assert ExcelReader._map_column("No.") is None
+
+    def test_map_column_ignores_case(self) -> None:
+        """English headers map regardless of case."""
+        assert ExcelReader._map_column("UNIVERSITY NAME") == "name_eng"
+        assert ExcelReader._map_column("website") == "website_url"
+
+    def test_region_mapping_sidecar(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """2023 files get regions from the 2024 reference file, cached in a JSON sidecar."""
+        for name, rows in [
+            ("2024-1 ref.xlsx", [["지역", "국가", "대학명"], ["북미", "미국", "Harvard"]]),
+            ("2023-1 old.xlsx", [["국가", "대학명"], ["미국", "MIT"]]),
+        ]:
+            wb = Workbook()
+            for row in rows:
+                wb.active.append(row)
+            wb.save(tmp_path / name)
+            wb.close()
+
+        sidecar = tmp_path / ".cache" / "region_map.json"
+        monkeypatch.setattr(ExcelReader, "REGION_MAP_FILE", sidecar)
+        monkeypatch.setattr(ExcelReader, "_region_mapping_cache", {})
+        assert ExcelReader(tmp_path / "2023-1 old.xlsx").read()["region"].tolist() == ["북미"]
+        assert sidecar.exists()
+        # The raw data directory holds only the workbooks
+        assert sorted(p.name for p in tmp_path.iterdir() if p.is_file()) == ["2023-1 old.xlsx", "2024-1 ref.xlsx"]
+
+        # A cold process reads the sidecar instead of the reference workbook
+        sidecar.write_text(sidecar.read_text(encoding="utf-8").replace("북미", "NA"), encoding="utf-8")
+        monkeypatch.setattr(ExcelReader, "_region_mapping_cache", {})
+        assert ExcelReader(tmp_path / "2023-1 old.xlsx").read()["region"].tolist() == ["NA"]
+
     def test_file_not_found(self, tmp_path: Path) -> None:
         """Test handling of non-existent file."""
         reader = ExcelReader(tmp_path / "nonexistent.xlsx")
 
         with pytest.raises(FileNotFoundError):
             reader.read()
+
+
+class TestReadExcelCached:
+    """Tests for read_excel_cached."""
+
+    def test_cache_hit_matches_fresh_read(self, tmp_path: Path) -> None:
+        """Second call is served from the cache and matches a fresh read."""
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["국가", "대학명"])
+        ws.append(["미국", "Harvard"])
+        file_path = tmp_path / "cached.xlsx"
+        wb.save(file_path)
+        wb.close()
+        cache_dir = tmp_path / "cache"
+
+        first = read_excel_cached(file_path, cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+        second = read_excel_cached(file_path, cache_dir=cache_dir)
+        pd.testing.assert_frame_equal(first, second)
+        pd.testing.assert_frame_equal(second, ExcelReader(file_path).read())
+
+    def test_reference_workbook_change_invalidates_2023_entry(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Editing the region reference workbook is not served from a stale 2023 cache entry."""
+        monkeypatch.setattr(ExcelReader, "REGION_MAP_FILE", tmp_path / ".cache" / "region_map.json")
+        cache_dir = tmp_path / "cache"
+
+        def write(name: str, rows: list) -> Path:
+            wb = Workbook()
+            for row in rows:
+                wb.active.append(row)
+            wb.save(tmp_path / name)
+            wb.close()
+            return tmp_path / name
+
+        ref = write("2024-1 ref.xlsx", [["지역", "국가", "대학명"], ["북미", "미국", "Harvard"]])
+        old = write("2023-1 old.xlsx", [["국가", "대학명"], ["미국", "MIT"]])
+        monkeypatch.setattr(ExcelReader, "_region_mapping_cache", {})
+        assert read_excel_cached(old, cache_dir=cache_dir)["region"].tolist() == ["북미"]
+
+        write(ref.name, [["지역", "국가", "대학명"], ["NA", "미국", "Harvard"]])
+        monkeypatch.setattr(ExcelReader, "_region_mapping_cache", {})
+        assert read_excel_cached(old, cache_dir=cache_dir)["region"].tolist() == ["NA"]
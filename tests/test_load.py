@@ -0,0 +1,126 @@
+"""Tests for load module."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pytest
+from sqlalchemy import BigInteger, func, select
+from sqlalchemy.ext.compiler import compiles
+
+from src.load.database import DatabaseLoader
+from src.load.models import LanguageRequirement, University
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_: BigInteger, compiler: Any, **kw: Any) -> str:
+    # Only an INTEGER PRIMARY KEY is a rowid alias (autoincrement) in SQLite
+    return "INTEGER"
+
+
+COLUMNS = ["name_kor", "name_eng", "nation", "program_type", "semester", "min_gpa", "language_requirement"]
+
+
+def make_df(rows: List[Tuple[Optional[str], ...]]) -> pd.DataFrame:
+    """Cleaned DataFrame with the columns load_universities_dataframe reads."""
+    return pd.DataFrame([dict(zip(COLUMNS, row)) for row in rows])
+
+
+class TestLoadUniversitiesDataframe:
+    """Tests for DatabaseLoader.load_universities_dataframe on in-memory SQLite."""
+
+    @pytest.fixture
+    def loader(self) -> DatabaseLoader:
+        loader = DatabaseLoader("sqlite://")
+        loader.create_tables()
+        return loader
+
+    def universities(self, loader: DatabaseLoader) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        with loader.SessionLocal() as session:
+            return {
+                (u.name_eng, u.nation): {"id": u.id, "semester": u.semester, "min_gpa": u.min_gpa, "region": u.region}
+                for u in session.scalars(select(University))
+            }
+
+    def requirements(self, loader: DatabaseLoader) -> List[Tuple[str, str, float]]:
+        with loader.SessionLocal() as session:
+            stmt = (
+                select(University.name_eng, LanguageRequirement.exam_type, LanguageRequirement.min_score)
+                .join(LanguageRequirement.university)
+                .order_by(University.name_eng, LanguageRequirement.exam_type)
+            )
+            return [tuple(row) for row in session.execute(stmt)]
+
+    def test_inserts_new_universities(self, loader: DatabaseLoader) -> None:
+        """New rows are inserted with their requirements; rows missing a key field are skipped."""
+        stats = loader.load_universities_dataframe(make_df([
+            ("가", "A Univ", "미국", "교환", "2025-1", "3.0", "TOEFL 80"),
+            ("나", "B Univ", "일본", "방문", "2025-1", "2.5", "JLPT N2"),
+            ("다", "C Univ", "독일", "교환", "2025-1", None, None),
+            (None, "D Univ", "독일", "교환", "2025-1", None, None),
+        ]))
+
+        assert stats == {"inserted": 3, "updated": 0, "skipped": 1, "language_reqs": 2}
+        universities = self.universities(loader)
+        assert sorted(universities) == [("A Univ", "미국"), ("B Univ", "일본"), ("C Univ", "독일")]
+        assert universities[("A Univ", "미국")]["min_gpa"] == 3.0
+        assert universities[("B Univ", "일본")]["region"] == "아시아"
+        assert self.requirements(loader) == [("A Univ", "TOEFL", 80.0), ("B Univ", "JLPT", 2.0)]
+
+    def test_merges_duplicate_keys_within_frame(self, loader: DatabaseLoader) -> None:
+        """Rows sharing (name_eng, nation) become one university; the last row's values win."""
+        stats = loader.load_universities_dataframe(make_df([
+            ("가", "A Univ", "미국", "교환", "2025-1", "3.0", "TOEFL 80"),
+            ("가", "A Univ", "미국", "교환", "2025-2", "3.2", "TOEFL 90"),
+            ("가", "A Univ", "캐나다", "교환", "2025-2", "3.2", None),
+        ]))
+
+        assert stats == {"inserted": 2, "updated": 1, "skipped": 0, "language_reqs": 2}
+        with loader.SessionLocal() as session:
+            assert session.scalar(select(func.count()).select_from(University)) == 2
+        a_univ = self.universities(loader)[("A Univ", "미국")]
+        assert a_univ["semester"] == "2025-2, 2025-1"
+        assert a_univ["min_gpa"] == 3.2
+        assert self.requirements(loader) == [("A Univ", "TOEFL", 90.0)]
+
+    def test_updates_existing_universities(self, loader: DatabaseLoader) -> None:
+        """A second load updates rows by key, merges semesters and replaces requirements."""
+        loader.load_universities_dataframe(make_df([
+            ("가", "A Univ", "미국", "교환", "2025-1", "3.0", "TOEFL 80"),
+            ("나", "B Univ", "일본", "교환", "2025-1", "2.5", "JLPT N2"),
+        ]))
+        ids_before = {key: u["id"] for key, u in self.universities(loader).items()}
+
+        stats = loader.load_universities_dataframe(make_df([
+            ("가", "A Univ", "미국", "교환", "2026-1", "3.3", None),
+            ("나", "B Univ", "일본", "교환", "2026-1", "2.7", "TOEFL 79"),
+            ("나", "B Univ", "일본", "교환", "2026-2", "2.7", "TOEFL 85"),
+            ("라", "E Univ", "영국", "교환", "2026-1", "3.0", "IELTS 6.5"),
+        ]))
+
+        assert stats == {"inserted": 1, "updated": 3, "skipped": 0, "language_reqs": 3}
+        universities = self.universities(loader)
+        assert len(universities) == 3
+        assert {key: universities[key]["id"] for key in ids_before} == ids_before
+        assert universities[("A Univ", "미국")]["semester"] == "2026-1, 2025-1"
+        assert universities[("A Univ", "미국")]["min_gpa"] == 3.3
+        assert universities[("B Univ", "일본")]["semester"] == "2026-2, 2026-1, 2025-1"
+        # A row without a requirement clears the university's old requirements
+        assert self.requirements(loader) == [
+            ("B Univ", "TOEFL", 85.0),
+            ("E Univ", "IELTS", 6.5),
+        ]
+
+    def test_padded_keys_match_existing_rows(self, loader: DatabaseLoader) -> None:
+        """Whitespace around name_eng / nation does not turn an update into a duplicate insert."""
+        loader.load_universities_dataframe(make_df([
+            ("가", "A Univ", "미국", "교환", "2025-1", "3.0", None),
+        ]))
+
+        stats = loader.load_universities_dataframe(make_df([
+            ("가", " A Univ", "미국 ", "교환", "2026-1", "3.0", None),
+        ]))
+
+        assert stats == {"inserted": 0, "updated": 1, "skipped": 0, "language_reqs": 0}
+        universities = self.universities(loader)
+        assert list(universities) == [("A Univ", "미국")]
+        assert universities[("A Univ", "미국")]["semester"] == "2026-1, 2025-1"
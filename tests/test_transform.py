@@ -35,3 +35,17 @@ class TestDataCleaner:
         assert result.iloc[0]["nation"] == "미국"
         assert result.iloc[0]["name_kor"] == "Harvard University"
 
+
+    def test_does_not_modify_input(self) -> None:
+        """Cleaning works on a shallow copy; the caller's DataFrame is left untouched."""
+        df = pd.DataFrame(
+            {
+                "nation": ["  미국  ", None],
+                "name_kor": ["Harvard   University", "Tokyo"],
+                "min_gpa": ["3.0 이상", None],
+            }
+        )
+        original = df.copy()
+        DataCleaner(df).clean()
+
+        pd.testing.assert_frame_equal(df, original)
@@ -0,0 +1,33 @@
+"""Tests for utils module."""
+
+from pathlib import Path
+
+from src.utils import format_table, list_excel_files, list_xlsx
+
+
+def test_list_xlsx_sorted_and_skips_lock_files(tmp_path: Path) -> None:
+    """Only .xlsx files are listed, sorted by name, without ~$ lock files."""
+    for name in ["2025-1.xlsx", "2024-2.xlsx", "~$2024-2.xlsx", "notes.txt", "old.xls"]:
+        (tmp_path / name).touch()
+    (tmp_path / "dir.xlsx").mkdir()
+
+    assert [p.name for p in list_xlsx(tmp_path)] == ["2024-2.xlsx", "2025-1.xlsx"]
+
+
+def test_list_excel_files_includes_xls(tmp_path: Path) -> None:
+    """.xlsx and .xls are listed together in one sorted list."""
+    for name in ["2025-1.xlsx", "2023-1.XLS", "~$2025-1.xlsx", "notes.txt"]:
+        (tmp_path / name).touch()
+
+    assert [p.name for p in list_excel_files(tmp_path)] == ["2023-1.XLS", "2025-1.xlsx"]
+
+
+def test_format_table_aligns_columns() -> None:
+    """Columns are padded to the widest cell and None prints as blank."""
+    text = format_table(["name", "gpa"], [("Nanjing", 3.0), ("A", None)])
+
+    assert text.splitlines() == [
+        "name     gpa",
+        "Nanjing  3.0",
+        "A",
+    ]